@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+from rest_framework_friendly_errors.settings import friendly_settings
+
+
+class FriendlyErrorsConfig(AppConfig):
+    name = 'rest_framework_friendly_errors'
+    verbose_name = 'DRF friendly errors'
+
+    def ready(self):
+        # Регистрирует проверки
+        from rest_framework_friendly_errors import checks
+
+        if friendly_settings.WARM_UP:
+            # Без импорта ROOT_URLCONF: он замедляет запуск и зависит от порядка INSTALLED_APPS
+            checks.warm_up(import_urlconf=False)
@@ -0,0 +1,182 @@
+from __future__ import unicode_literals
+
+from importlib import import_module
+
+from django.conf import settings
+from django.core import checks
+from rest_framework.fields import Field
+from rest_framework.serializers import BaseSerializer
+
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+from rest_framework_friendly_errors.resolvers import (build_field_metadata, get_fields_metadata,
+                                                      get_non_field_error_codes, get_validator_error_codes)
+from rest_framework_friendly_errors.settings import DEFAULTS, TABLES, friendly_settings
+
+
+def get_subclasses(klass):
+    subclasses = []
+    stack = [klass]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in subclasses:
+                subclasses.append(subclass)
+                stack.append(subclass)
+    return subclasses
+
+
+def import_serializers():
+    """
+    Сериалайзеры обычно импортируются вместе с views, поэтому импортируем ROOT_URLCONF
+    """
+    urlconf = getattr(settings, 'ROOT_URLCONF', None)
+    if urlconf:
+        import_module(urlconf)
+
+
+def get_serializer_classes(app_configs=None):
+    serializer_classes = get_subclasses(FriendlyErrorMessagesMixin)
+    if app_configs is None:
+        return serializer_classes
+    app_names = tuple(app_config.name for app_config in app_configs)
+    return [
+        klass for klass in serializer_classes
+        if klass.__module__ in app_names or klass.__module__.startswith(tuple(name + '.' for name in app_names))
+    ]
+
+
+def warm_up(import_urlconf=True):
+    """
+    Строит таблицы кодов ошибок и метаданные объявленных полей всех сериалайзеров с FriendlyErrorMessagesMixin,
+    чтобы первые запросы не тратили на это время.
+
+    import_urlconf=False - только для уже импортированных сериалайзеров (так вызывается из AppConfig.ready)
+    """
+    if import_urlconf:
+        import_serializers()
+    for attr in TABLES:
+        getattr(friendly_settings, attr)
+    for serializer_class in get_serializer_classes():
+        get_non_field_error_codes(serializer_class)
+        get_validator_error_codes(serializer_class)
+        get_fields_metadata(serializer_class, getattr(serializer_class, '_declared_fields', {}))
+
+
+def check_field_class_names():
+    """
+    Ключи FIELD_ERRORS, которым не соответствует ни один класс поля
+    """
+    field_class_names = {klass.__name__ for klass in get_subclasses(Field)}
+    field_class_names.add(Field.__name__)
+    return [
+        checks.Warning(
+            "FRIENDLY_ERRORS['FIELD_ERRORS'] has codes for unknown field class '%s'." % name,
+            hint='Check the spelling or import the module that defines this field.',
+            id='rest_framework_friendly_errors.W001',
+        )
+        for name in friendly_settings.user_settings.get('FIELD_ERRORS', {})
+        if name not in field_class_names
+    ]
+
+
+def iter_setting_codes(defaults=False):
+    """
+    (ключ в FRIENDLY_ERRORS, путь до кода, ключ ошибки, код) для всех таблиц кодов.
+    defaults=True - для таблиц по умолчанию, без FRIENDLY_ERRORS
+    """
+    for attr, (user_key, default, build) in TABLES.items():
+        table = build(default, {}) if defaults else getattr(friendly_settings, attr)
+        for key, value in table.items():
+            if attr == 'FRIENDLY_FIELD_ERRORS':
+                for error_key, code in value.items():
+                    yield user_key, '%s.%s' % (key, error_key), error_key, code
+            else:
+                yield user_key, key, key, value
+
+
+def get_code_usages(defaults=False):
+    """
+    {код: {ключ ошибки: [(ключ в FRIENDLY_ERRORS, путь до кода)]}}
+    """
+    validation_failed_code = DEFAULTS['VALIDATION_FAILED_CODE'] if defaults else friendly_settings.VALIDATION_FAILED_CODE
+    usages = {validation_failed_code: {'VALIDATION_FAILED_CODE': [('VALIDATION_FAILED_CODE', 'VALIDATION_FAILED_CODE')]}}
+    for user_key, path, error_key, code in iter_setting_codes(defaults):
+        if code is not None:
+            usages.setdefault(code, {}).setdefault(error_key, []).append((user_key, path))
+    return usages
+
+
+def check_missing_codes():
+    return [
+        checks.Warning(
+            "FRIENDLY_ERRORS['%s'] has no code for '%s'." % (user_key, path),
+            hint='Such errors are returned with "code": null.',
+            id='rest_framework_friendly_errors.W002',
+        )
+        for user_key, path, error_key, code in iter_setting_codes()
+        if code is None
+    ]
+
+
+def check_conflicting_codes():
+    """
+    Один и тот же код для разных ошибок: в разных таблицах (н-р, у ошибки поля и у исключения)
+    или внутри одной (н-р, 'required' и 'invalid' в FIELD_ERRORS).
+
+    В таблицах по умолчанию такие совпадения уже есть (н-р, 'invalid' и 'max_length'),
+    поэтому сообщаем только о тех, что добавлены в FRIENDLY_ERRORS
+    """
+    default_usages = get_code_usages(defaults=True)
+    errors = []
+    for code, error_keys in get_code_usages().items():
+        # Н-р, один и тот же валидатор в VALIDATOR_ERRORS и NON_FIELD_ERRORS
+        if len(error_keys) < 2:
+            continue
+        if set(error_keys) <= set(default_usages.get(code, {})):
+            continue
+        errors.append(checks.Warning(
+            'Error code %s is used for different errors: %s.' % (
+                code, ', '.join("'%s' in %s" % (path, user_key) for user_key, path in sorted(
+                    usage for usages in error_keys.values() for usage in usages
+                ))
+            ),
+            hint='Clients can not tell these errors apart by code.',
+            id='rest_framework_friendly_errors.W003',
+        ))
+    return errors
+
+
+def check_serializer(serializer_class):
+    errors = []
+    for attr in ('FIELD_VALIDATION_ERRORS', 'NON_FIELD_ERRORS'):
+        for name, code in getattr(serializer_class, attr, {}).items():
+            if code is None:
+                errors.append(checks.Warning(
+                    "%s has no code for '%s'." % (attr, name),
+                    hint='Such errors are returned with "code": null.',
+                    obj=serializer_class,
+                    id='rest_framework_friendly_errors.W002',
+                ))
+
+    for field_name, field in getattr(serializer_class, '_declared_fields', {}).items():
+        # Вложенные сериалайзеры проверяются отдельно
+        if isinstance(field, BaseSerializer):
+            continue
+        if not build_field_metadata(field).error_codes:
+            errors.append(checks.Warning(
+                "Field '%s' (%s) has no error codes." % (field_name, type(field).__name__),
+                hint="Add codes for '%s' or one of its parents to FRIENDLY_ERRORS['FIELD_ERRORS']." % (
+                    type(field).__name__
+                ),
+                obj=serializer_class,
+                id='rest_framework_friendly_errors.W004',
+            ))
+    return errors
+
+
+@checks.register(checks.Tags.compatibility)
+def check_error_codes(app_configs=None, **kwargs):
+    import_serializers()
+    errors = check_field_class_names() + check_missing_codes() + check_conflicting_codes()
+    for serializer_class in get_serializer_classes(app_configs):
+        errors.extend(check_serializer(serializer_class))
+    return errors
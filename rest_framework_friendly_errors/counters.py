@@ -0,0 +1,95 @@
+from __future__ import unicode_literals
+
+import threading
+from collections import Counter
+
+METRIC_NAME = 'friendly_errors_total'
+METRIC_HELP = 'Number of error codes returned by drf-friendly-errors.'
+
+
+class ErrorCounters:
+    """
+    Счетчики кодов ошибок в рамках процесса, ключ - (code, field, exception).
+
+    У каждого потока свой Counter, поэтому при увеличении счетчика блокировок нет.
+    Блокировка берется только при первом обращении потока и при сборе значений
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters = []
+
+    def _get_counter(self):
+        try:
+            return self._local.counter
+        except AttributeError:
+            counter = self._local.counter = Counter()
+            with self._lock:
+                self._counters.append(counter)
+            return counter
+
+    def increment(self, code, field=None, exception='ValidationError'):
+        self._get_counter()[(code, field, exception)] += 1
+
+    def count_entries(self, pretty_errors, exception='ValidationError'):
+        """
+        Считает коды из ответа build_pretty_errors.
+
+        Учитываются только конечные ошибки, обертки вложенных ошибок (VALIDATION_FAILED_CODE) пропускаются
+        """
+        entries = pretty_errors.get('errors')
+        if not entries:
+            self.increment(pretty_errors.get('code'), None, exception)
+            return
+        self.count_entry_list(entries, exception)
+
+    def count_entry_list(self, entries, exception='ValidationError'):
+        counter = self._get_counter()
+        stack = list(entries)
+        while stack:
+            entry = stack.pop()
+            if entry.get('errors'):
+                stack.extend(entry['errors'])
+            else:
+                counter[(entry.get('code'), entry.get('field'), exception)] += 1
+
+    def collect(self):
+        with self._lock:
+            counters = list(self._counters)
+
+        total = Counter()
+        for counter in counters:
+            # dict(counter) копируется целиком под GIL, поток-владелец не помешает
+            total.update(dict(counter))
+        return total
+
+    def reset(self):
+        with self._lock:
+            for counter in self._counters:
+                counter.clear()
+
+
+error_counters = ErrorCounters()
+
+
+def escape_label_value(value):
+    if value is None:
+        return ''
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def render_prometheus(counters=None):
+    """
+    Счетчики в текстовом формате Prometheus (exposition format 0.0.4)
+    """
+    counters = error_counters if counters is None else counters
+    lines = [
+        '# HELP %s %s' % (METRIC_NAME, METRIC_HELP),
+        '# TYPE %s counter' % METRIC_NAME,
+    ]
+    for (code, field, exception), value in sorted(counters.collect().items(), key=lambda item: repr(item[0])):
+        lines.append('%s{code="%s",field="%s",exception="%s"} %d' % (
+            METRIC_NAME, escape_label_value(code), escape_label_value(field), escape_label_value(exception), value
+        ))
+    return '\n'.join(lines) + '\n'
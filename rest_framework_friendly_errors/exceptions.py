@@ -0,0 +1,49 @@
+from __future__ import unicode_literals
+
+from rest_framework.exceptions import ErrorDetail, ValidationError
+
+from rest_framework_friendly_errors.utils import is_pretty_data
+
+
+def map_details(detail, func):
+    """
+    Применяет func к ErrorDetail в detail, остальные значения (int коды, None) оставляет как есть
+    """
+    if isinstance(detail, list):
+        return [map_details(item, func) for item in detail]
+    if isinstance(detail, dict):
+        return {key: map_details(value, func) for key, value in detail.items()}
+    if isinstance(detail, ErrorDetail):
+        return func(detail)
+    return detail
+
+
+class FriendlyValidationError(ValidationError):
+    """
+    ValidationError с уже готовым ответом от FriendlyErrorMessagesMixin.
+
+    В отличие от ValidationError не приводит значения к строкам,
+    поэтому коды ошибок остаются int, а field - None,
+    и обработчику исключений не нужно их преобразовывать обратно
+    """
+
+    def __init__(self, detail):
+        self.detail = detail
+
+    def get_codes(self):
+        return map_details(self.detail, lambda detail: detail.code)
+
+    def get_full_details(self):
+        return map_details(self.detail, lambda detail: {'message': detail, 'code': detail.code})
+
+
+def get_validation_error(errors):
+    """
+    FriendlyValidationError для готового ответа сериалайзера.
+
+    Необработанные ошибки (н-р, raise ValidationError({'code': 228, ...}) в validate())
+    выбрасываются обычным ValidationError, чтобы обработчик исключений преобразовал их значения
+    """
+    if is_pretty_data(errors):
+        return FriendlyValidationError(errors)
+    return ValidationError(errors)
@@ -0,0 +1,84 @@
+from __future__ import unicode_literals
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connections
+from django.utils import translation
+
+from rest_framework_friendly_errors.settings import friendly_settings
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def get_executor():
+    """
+    Общий пул потоков для CONCURRENT_VALIDATION, размер - MAX_VALIDATION_WORKERS
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=friendly_settings.MAX_VALIDATION_WORKERS,
+                    thread_name_prefix='friendly-errors'
+                )
+    return _executor
+
+
+def in_worker():
+    return getattr(_worker, 'active', False)
+
+
+def in_atomic_block():
+    """
+    True, если в текущем потоке открыта транзакция.
+
+    Потоки пула работают со своими соединениями с БД и не видят изменений этой транзакции,
+    поэтому в ней поля валидируются последовательно
+    """
+    return any(connection.in_atomic_block for connection in connections.all())
+
+
+def _run_in_worker(language, func, *args):
+    _worker.active = True
+    # Как на request_started/request_finished: соединения потока пула живут по CONN_MAX_AGE
+    close_old_connections()
+    try:
+        # Язык активируется через asgiref Local, который не виден из других потоков даже в копии контекста
+        with translation.override(language):
+            return func(*args)
+    finally:
+        _worker.active = False
+        close_old_connections()
+
+
+def submit(func, *args):
+    """
+    Запускает func в пуле.
+
+    func выполняется в копии контекста и с активным языком вызывающего потока.
+    Внутри потока пула вложенные сериалайзеры валидируются последовательно (см. in_worker),
+    иначе они бы ждали свободный поток, занимая текущий
+    """
+    return get_executor().submit(copy_context().run, _run_in_worker, translation.get_language(), func, *args)
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+
+
+def reset_executor(*args, **kwargs):
+    if kwargs['setting'] == 'FRIENDLY_ERRORS':
+        shutdown_executor()
+
+
+setting_changed.connect(reset_executor)
@@ -1,7 +1,15 @@
-from rest_framework.views import exception_handler
-from rest_framework.exceptions import APIException
+from time import perf_counter
 
-from rest_framework_friendly_errors import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+from rest_framework.views import exception_handler, set_rollback
+
+from rest_framework_friendly_errors.settings import friendly_settings
+from rest_framework_friendly_errors.counters import error_counters
+from rest_framework_friendly_errors.exceptions import FriendlyValidationError
+from rest_framework_friendly_errors.instrumentation import emit_metrics
+from rest_framework_friendly_errors.messages import resolve_message
 from rest_framework_friendly_errors.utils import is_pretty, get_int_value
 
 
@@ -23,6 +31,23 @@ def get_transformed_value(value):
     return value
 
 
+def transform_values(container):
+    """
+    То же, что и get_transformed_value, но изменяет списки и словари на месте,
+    заменяя только те значения, которые действительно изменились
+    """
+    items = container.items() if isinstance(container, dict) else enumerate(container)
+    for key, value in items:
+        if isinstance(value, (list, dict)):
+            transform_values(value)
+        # int, None и т.д. уже преобразованы, их пропускаем
+        elif isinstance(value, str):
+            if value == 'None':
+                container[key] = None
+            elif value.isdigit():
+                container[key] = get_int_value(value, value)
+
+
 def transform_response_data_values(response):
     """
     Костыль, чтобы компенсировать конвертацию в str всех значений дикта ошибок
@@ -45,36 +70,71 @@ def transform_response_data_values(response):
             'detail': response.data
         }
 
-    data = {}
-    for key, value in response.data.items():
-        data[key] = get_transformed_value(value)
-    response.data = data
+    transform_values(response.data)
+
+
+def get_server_error_response(exc):
+    """
+    Ответ 500 для исключений, которые не обрабатывает DRF (при CATCH_ALL_EXCEPTIONS).
+
+    Собираем ответ сразу, без повторного вызова exception_handler
+    """
+    if friendly_settings.CATCH_ALL_EXCEPTIONS_DETAIL:
+        detail = str(exc)
+    else:
+        detail = APIException.default_detail
+    set_rollback()
+    return Response({'detail': detail}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 def friendly_exception_handler(exc, context):
+    if not friendly_settings.INSTRUMENTATION:
+        return get_friendly_response(exc, context)
+
+    started = perf_counter()
+    response = get_friendly_response(exc, context)
+    errors = response.data.get('errors') if response is not None and isinstance(response.data, dict) else None
+    emit_metrics(
+        'exception_handler', type(exc),
+        duration=perf_counter() - started,
+        errors=len(errors) if isinstance(errors, list) else 0,
+        depth=None,
+        status_code=response.status_code if response is not None else None,
+    )
+    return response
+
+
+def get_friendly_response(exc, context):
     response = exception_handler(exc, context)
 
-    if not response and settings.CATCH_ALL_EXCEPTIONS:
-        exc = APIException(exc)
-        response = exception_handler(exc, context)
+    if response is None and friendly_settings.CATCH_ALL_EXCEPTIONS:
+        response = get_server_error_response(exc)
 
     if response is not None:
-        transform_response_data_values(response)
+        # Ответ от FriendlyErrorMessagesMixin уже содержит int коды и None,
+        # преобразовывать нужно только ValidationError, выброшенные разработчиком
+        if not isinstance(exc, FriendlyValidationError):
+            transform_response_data_values(response)
 
         # Стандартные ошибки из сериалайзера. Уже обработаны на уровне сериалайзера
         if is_pretty(response):
+            # Ленивая строка (н-р, VALIDATION_FAILED_MESSAGE) переводится через кэш, а не при каждом рендеринге
+            response.data['message'] = resolve_message(response.data['message'])
+            # Ошибки FriendlyValidationError уже посчитаны в сериалайзере
+            if friendly_settings.COUNT_ERRORS and not isinstance(exc, FriendlyValidationError):
+                error_counters.count_entries(response.data, exc.__class__.__name__)
             return response
 
-        code = settings.FRIENDLY_EXCEPTION_DICT.get(
+        code = friendly_settings.FRIENDLY_EXCEPTION_DICT.get(
             exc.__class__.__name__,
-            settings.FRIENDLY_EXCEPTION_DICT['APIException']
+            friendly_settings.FRIENDLY_EXCEPTION_DICT['APIException']
         )
         # Стандартные ошибки по типу Not Authenticated, PermissionDenied и т.д.
         # Или случай, когда была передана просто строка
         detail = response.data.pop('detail', None)
         if detail:
             response.data['code'] = code
-            response.data['message'] = detail
+            response.data['message'] = resolve_message(detail)
             response.data['errors'] = []
         # Случай кастомных ошибок (разработичик сам сделал raise ValidationError).
         # В этом случае ниче не преобразуем, только на всякий случай дефолтные значения поставим
@@ -82,4 +142,6 @@ def friendly_exception_handler(exc, context):
         response.data.setdefault('errors', [])
         response.data.setdefault('code', code)
         response.data.setdefault('message', 'Error')
+        if friendly_settings.COUNT_ERRORS:
+            error_counters.count_entries(response.data, exc.__class__.__name__)
     return response
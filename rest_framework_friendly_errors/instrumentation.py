@@ -0,0 +1,40 @@
+from __future__ import unicode_literals
+
+import logging
+
+from django.dispatch import Signal
+
+from rest_framework_friendly_errors.settings import friendly_settings
+
+logger = logging.getLogger('rest_framework_friendly_errors')
+
+# Отправляется после форматирования ошибок, если включен INSTRUMENTATION.
+# sender - класс сериалайзера или исключения, metrics - dict с метриками
+errors_formatted = Signal()
+
+
+def emit_metrics(stage, sender, **metrics):
+    """
+    Отправляет метрики в сигнал errors_formatted и в INSTRUMENTATION_CALLBACK.
+
+    stage - 'build_pretty_errors' или 'exception_handler',
+    в metrics: duration (сек.), errors, depth, validators_rerun
+    """
+    metrics['stage'] = stage
+    metrics['sender'] = sender.__name__
+    errors_formatted.send(sender=sender, metrics=metrics)
+
+    callback = friendly_settings.INSTRUMENTATION_CALLBACK
+    if callback is not None:
+        callback(metrics)
+
+
+def log_metrics(metrics):
+    """
+    Готовый INSTRUMENTATION_CALLBACK: пишет метрики в лог,
+    в extra записи они лежат под ключом friendly_errors
+    """
+    logger.info(
+        '%(sender)s %(stage)s: %(duration).6fs, errors=%(errors)s, depth=%(depth)s', metrics,
+        extra={'friendly_errors': metrics}
+    )
@@ -0,0 +1,64 @@
+from __future__ import unicode_literals
+
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.utils.functional import Promise
+from django.utils.translation import get_language
+
+# Количество переведенных сообщений (сообщение, язык, параметры) в кэше
+MESSAGE_CACHE_SIZE = 1024
+
+# При изменении этих настроек переводы могут измениться
+TRANSLATION_SETTINGS = {'LANGUAGE_CODE', 'LANGUAGES', 'LOCALE_PATHS', 'FRIENDLY_ERRORS'}
+
+
+class MessageKey:
+    """
+    Ключ кэша для ленивой строки перевода - сама строка, но сравнение и hash по id.
+
+    hash() ленивой строки переводит ее, а именно этого кэш и избегает.
+    Ключ держит ссылку на строку, поэтому ее id не переиспользуется, пока она в кэше
+    """
+    __slots__ = ('message',)
+
+    def __init__(self, message):
+        self.message = message
+
+    def __hash__(self):
+        return id(self.message)
+
+    def __eq__(self, other):
+        return self.message is other.message
+
+
+@lru_cache(maxsize=MESSAGE_CACHE_SIZE)
+def _resolve_message(key, language, params):
+    message = str(key.message)
+    if params:
+        message = message.format(**dict(params))
+    return message
+
+
+def resolve_message(message, **params):
+    """
+    Ленивая строка перевода (н-р, VALIDATION_FAILED_MESSAGE) -> str на текущем языке.
+
+    Переведенная строка кэшируется по (id строки, язык, параметры форматирования),
+    поэтому одно и то же сообщение переводится один раз на язык, а не на каждую ошибку
+    """
+    if not isinstance(message, Promise):
+        return message.format(**params) if params else message
+    return _resolve_message(MessageKey(message), get_language(), tuple(sorted(params.items())) or None)
+
+
+def clear_message_cache():
+    _resolve_message.cache_clear()
+
+
+def reload_messages(*args, **kwargs):
+    if kwargs['setting'] in TRANSLATION_SETTINGS:
+        clear_message_cache()
+
+
+setting_changed.connect(reload_messages)
@@ -1,26 +1,142 @@
 from __future__ import unicode_literals
-from __future__ import unicode_literals
 
-from typing import Mapping
+import asyncio
+import inspect
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextvars import ContextVar
+from functools import partial
+from time import perf_counter
+
+from asgiref.sync import async_to_sync, sync_to_async
 
-from rest_framework.exceptions import ValidationError as RestValidationError
-from rest_framework.fields import *
-from rest_framework.relations import *
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import Field, SkipField, empty, get_error_detail, set_value
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+from rest_framework.settings import api_settings
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from rest_framework_friendly_errors import settings
-from rest_framework_friendly_errors.utils import as_serializer_error
+from rest_framework_friendly_errors.settings import friendly_settings
+from rest_framework_friendly_errors.counters import error_counters
+from rest_framework_friendly_errors.exceptions import get_validation_error
+from rest_framework_friendly_errors.executor import in_atomic_block, in_worker, submit
+from rest_framework_friendly_errors.instrumentation import emit_metrics
+from rest_framework_friendly_errors.messages import resolve_message
+from rest_framework_friendly_errors.resolvers import (build_field_metadata, get_field_metadata,
+                                                      get_non_field_error_codes, get_validator_error_codes)
+from rest_framework_friendly_errors.utils import (ErrorLimit, as_serializer_error, count_errors, drain,
+                                                  get_validator_name, is_async_callable)
+
+
+# Валидаторы поля [(serializer, field_name, validator, args)], которые во время async валидации поля
+# выполняются после field.run_validation в порядке field.validators (см. arun_with_deferred_validators).
+# ContextVar, т.к. при CONCURRENT_VALIDATION поля одного сериалайзера валидируются одновременно
+deferred_validators = ContextVar('deferred_validators', default=None)
+
+
+# Поля и валидаторы Django и DRF не ходят в БД (кроме валидаторов с queryset и связанных полей)
+BUILTIN_MODULES = ('django.', 'rest_framework.')
+
+
+def is_builtin(obj):
+    return (getattr(obj, '__module__', None) or '').startswith(BUILTIN_MODULES)
+
+
+def is_deferred(validator):
+    """
+    В async режиме выполняются через await (синхронные - через sync_to_async)
+    асинхронные валидаторы, валидаторы с запросами в БД (UniqueValidator и т.д.)
+    и все пользовательские валидаторы, чтобы не блокировать event loop
+    и не получать SynchronousOnlyOperation при обращении к ORM
+    """
+    return is_async_callable(validator) or hasattr(validator, 'queryset') or not is_builtin(validator)
+
+
+def tracks_validators(field):
+    """
+    Запуск валидаторов подменяется только у полей со стандартным Field.run_validators,
+    переопределенный в классе поля run_validators выполняется как есть
+    """
+    return type(field).run_validators is Field.run_validators
+
+
+def call(func, *args):
+    """
+    Вызывает func, корутины (async validate_<field_name> и т.д.) выполняются через async_to_sync
+    """
+    if is_async_callable(func):
+        return async_to_sync(func)(*args)
+    return func(*args)
+
+
+async def acall(func, *args):
+    """
+    Вызывает func через await, если это корутина, иначе в отдельном потоке через sync_to_async
+    """
+    if is_async_callable(func):
+        return await func(*args)
+    return await sync_to_async(func)(*args)
 
 
 class FriendlyErrorMessagesMixin:
     FIELD_VALIDATION_ERRORS = {}
     NON_FIELD_ERRORS = {}
+    # True - валидировать поля одновременно (пул потоков MAX_VALIDATION_WORKERS или asyncio.gather в ais_valid).
+    # Имеет смысл, если у нескольких полей медленные валидаторы (запросы в БД, внешние сервисы)
+    CONCURRENT_VALIDATION = False
+    # Количество полей с ошибками, после которого валидация остальных полей прекращается.
+    # None - валидировать все поля
+    MAX_FIELD_ERRORS = None
+
+    def __init__(self, *args, **kwargs):
+        super(FriendlyErrorMessagesMixin, self).__init__(*args, **kwargs)
+        # {field_name: {(message, code): validator_name}}
+        self._error_sources = {}
+        # (_errors, pretty_errors) - ошибки разбираются один раз на каждую валидацию
+        self._pretty_errors = None
+        # Сколько раз валидаторы перезапускались при поиске источника ошибки
+        self._validators_rerun = 0
+        # Переведенный VALIDATION_FAILED_MESSAGE, см. get_validation_failed_message
+        self._validation_failed_message = None
+
+    def is_valid(self, raise_exception=False):
+        self._pretty_errors = None
+        self._validation_failed_message = None
+        is_valid = super(FriendlyErrorMessagesMixin, self).is_valid()
+        if not is_valid and raise_exception:
+            raise get_validation_error(self.errors)
+        return is_valid
 
     @property
     def errors(self):
+        ugly_errors = getattr(self, '_errors', None)
+        if self._pretty_errors is not None and self._pretty_errors[0] is ugly_errors:
+            return self._pretty_errors[1]
+
         ugly_errors = super(FriendlyErrorMessagesMixin, self).errors
-        pretty_errors = self.build_pretty_errors(ugly_errors)
-        return ReturnDict(pretty_errors, serializer=self)
+        limit = ErrorLimit(friendly_settings.MAX_ERRORS, friendly_settings.MAX_NESTED_DEPTH)
+        if friendly_settings.INSTRUMENTATION:
+            started, validators_rerun = perf_counter(), self._validators_rerun
+            pretty_errors = self.build_pretty_errors(ugly_errors, limit=limit)
+            emit_metrics(
+                'build_pretty_errors', type(self),
+                duration=perf_counter() - started,
+                errors=limit.count,
+                depth=limit.depth,
+                validators_rerun=self._validators_rerun - validators_rerun,
+            )
+        else:
+            pretty_errors = self.build_pretty_errors(ugly_errors, limit=limit)
+        pretty_errors = ReturnDict(pretty_errors, serializer=self)
+        if limit.truncated:
+            pretty_errors['truncated'] = True
+            pretty_errors['total'] = count_errors(ugly_errors)
+        if friendly_settings.COUNT_ERRORS:
+            error_counters.count_entries(pretty_errors)
+        self._pretty_errors = (self._errors, pretty_errors)
+        return pretty_errors
 
     def run_validation(self, data=empty):
         """
@@ -34,23 +150,312 @@ class FriendlyErrorMessagesMixin:
         value = self.to_internal_value(data)
         try:
             self.run_validators(value)
-            value = self.validate(value)
+            value = call(self.validate, value)
             assert value is not None, '.validate() should return the validated data'
         except (ValidationError, DjangoValidationError) as exc:
             raise ValidationError(detail=as_serializer_error(exc))
         return value
 
-    def find_key(self, field, error, field_name):
-        if getattr(error, 'code', None):
-            return error.code
+    def to_internal_value(self, data):
+        """
+        Повторяет Serializer.to_internal_value, но запоминает,
+        что ошибку выбросил метод validate_<field_name>,
+        чтобы потом не вызывать его повторно.
+
+        При CONCURRENT_VALIDATION поля валидируются в пуле потоков (кроме валидации внутри транзакции),
+        при MAX_FIELD_ERRORS валидация прекращается после MAX_FIELD_ERRORS полей с ошибками
+        """
+        if isinstance(self, ListSerializer):
+            return super(FriendlyErrorMessagesMixin, self).to_internal_value(data)
+
+        if not isinstance(data, Mapping):
+            message = self.error_messages['invalid'].format(
+                datatype=type(data).__name__
+            )
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='invalid')
+
+        ret = OrderedDict()
+        errors = OrderedDict()
+
+        fields = list(self._writable_fields)
+        futures = []
+        if self.CONCURRENT_VALIDATION and not in_worker() and not in_atomic_block():
+            # Результаты забираем в порядке полей, поэтому ошибки всегда в одном и том же порядке
+            futures = [submit(self.run_field_validation, field, data) for field in fields]
+            results = [future.result for future in futures]
+        else:
+            results = [partial(self.run_field_validation, field, data) for field in fields]
+
+        for field, get_result in zip(fields, results):
+            if self.MAX_FIELD_ERRORS is not None and len(errors) >= self.MAX_FIELD_ERRORS:
+                # Остальные поля не валидируем, еще не запущенные в пуле - отменяем
+                for future in futures:
+                    future.cancel()
+                break
+            try:
+                validated_value = get_result()
+            except ValidationError as exc:
+                errors[field.field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field.field_name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                set_value(ret, field.source_attrs, validated_value)
+
+        if errors:
+            raise ValidationError(errors)
+
+        return ret
+
+    def run_field_validation(self, field, data):
+        validate_method = getattr(self, 'validate_' + field.field_name, None)
+        validated_value = field.run_validation(field.get_value(data))
+        if validate_method is not None:
+            try:
+                validated_value = call(validate_method, validated_value)
+            except (ValidationError, DjangoValidationError) as exc:
+                self.record_error_source(field.field_name, exc, validate_method)
+                raise
+        return validated_value
+
+    async def ais_valid(self, raise_exception=False):
+        """
+        Асинхронный is_valid для async views.
+
+        Асинхронные валидаторы и методы validate_<field_name>/validate ожидаются через await,
+        синхронные, которые могут ходить в БД, выполняются через sync_to_async
+        """
+        assert hasattr(self, 'initial_data'), (
+            'Cannot call `.ais_valid()` as no `data=` keyword argument was '
+            'passed when instantiating the serializer instance.'
+        )
+        self._pretty_errors = None
+        self._validation_failed_message = None
+        if not hasattr(self, '_validated_data'):
+            try:
+                self._validated_data = await self.arun_validation(self.initial_data)
+            except ValidationError as exc:
+                self._validated_data = {}
+                self._errors = exc.detail
+            else:
+                self._errors = {}
+
+        if self._errors and raise_exception:
+            raise get_validation_error(await self.aget_errors())
+        return not bool(self._errors)
+
+    async def aget_errors(self):
+        """
+        serializer.errors для async кода.
+
+        Поиск источника ошибки может перезапускать валидаторы (и делать запросы в БД),
+        поэтому ошибки строятся в отдельном потоке
+        """
+        if self._pretty_errors is not None and self._pretty_errors[0] is getattr(self, '_errors', None):
+            return self._pretty_errors[1]
+        return await sync_to_async(getattr)(self, 'errors')
+
+    async def arun_validation(self, data=empty):
+        (is_empty_value, data) = self.validate_empty_values(data)
+        if is_empty_value:
+            return data
+
+        value = await self.ato_internal_value(data)
+        try:
+            await self.arun_with_deferred_validators(self.run_validators, value)
+            value = await acall(self.validate, value)
+            assert value is not None, '.validate() should return the validated data'
+        except (ValidationError, DjangoValidationError) as exc:
+            raise ValidationError(detail=as_serializer_error(exc))
+        return value
+
+    async def ato_internal_value(self, data):
+        if isinstance(self, ListSerializer):
+            return await sync_to_async(super(FriendlyErrorMessagesMixin, self).to_internal_value)(data)
+
+        if not isinstance(data, Mapping):
+            message = self.error_messages['invalid'].format(
+                datatype=type(data).__name__
+            )
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='invalid')
+
+        ret = OrderedDict()
+        errors = OrderedDict()
+
+        fields = list(self._writable_fields)
+        results = None
+        if self.CONCURRENT_VALIDATION:
+            results = await asyncio.gather(
+                *[self.avalidate_field(field, data) for field in fields], return_exceptions=True
+            )
+
+        for index, field in enumerate(fields):
+            if self.MAX_FIELD_ERRORS is not None and len(errors) >= self.MAX_FIELD_ERRORS:
+                break
+            try:
+                if results is None:
+                    validated_value = await self.avalidate_field(field, data)
+                elif isinstance(results[index], BaseException):
+                    raise results[index]
+                else:
+                    validated_value = results[index]
+            except ValidationError as exc:
+                errors[field.field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field.field_name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                set_value(ret, field.source_attrs, validated_value)
+
+        if errors:
+            raise ValidationError(errors)
+
+        return ret
+
+    async def avalidate_field(self, field, data):
+        validate_method = getattr(self, 'validate_' + field.field_name, None)
+        validated_value = await self.arun_field_validation(field, field.get_value(data))
+        if validate_method is not None:
+            try:
+                validated_value = await acall(validate_method, validated_value)
+            except (ValidationError, DjangoValidationError) as exc:
+                self.record_error_source(field.field_name, exc, validate_method)
+                raise
+        return validated_value
+
+    async def arun_field_validation(self, field, data):
+        if isinstance(field, FriendlyErrorMessagesMixin):
+            return await field.arun_validation(data)
+
+        run_validation = field.run_validation
+        # Связанные поля и обычные вложенные сериалайзеры делают запросы в БД,
+        # пользовательские поля тоже могут их делать в to_internal_value
+        if isinstance(field, (BaseSerializer, RelatedField, ManyRelatedField)) or not is_builtin(field):
+            run_validation = sync_to_async(run_validation)
+        return await self.arun_with_deferred_validators(run_validation, data)
+
+    async def arun_with_deferred_validators(self, func, *args):
+        """
+        Вызывает func, откладывая валидаторы полей.
+
+        Затем выполняет их в порядке field.validators: асинхронные и блокирующие (is_deferred)
+        через await, остальные - сразу, и собирает все ошибки вместе, как это делает Field.run_validators
+        """
+        deferred = []
+        token = deferred_validators.set(deferred)
+        errors = []
+        result = None
+        try:
+            result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+        except ValidationError as exc:
+            if not deferred or not isinstance(exc.detail, list):
+                raise
+            errors.extend(exc.detail)
+        finally:
+            deferred_validators.reset(token)
+
+        for serializer, field_name, validator, validator_args in deferred:
+            try:
+                if is_deferred(validator):
+                    await acall(validator, *validator_args)
+                else:
+                    validator(*validator_args)
+            except ValidationError as exc:
+                serializer.record_error_source(field_name, exc, validator)
+                if isinstance(exc.detail, dict):
+                    raise
+                errors.extend(exc.detail if isinstance(exc.detail, list) else [exc.detail])
+            except DjangoValidationError as exc:
+                serializer.record_error_source(field_name, exc, validator)
+                errors.extend(get_error_detail(exc))
+
+        if errors:
+            raise ValidationError(errors)
+        return result
 
-        if getattr(field, 'child_relation', None):
-            return self.find_key(field=field.child_relation, error=error, field_name=field_name)
+    def get_fields(self):
+        fields = super(FriendlyErrorMessagesMixin, self).get_fields()
+        for field_name, field in fields.items():
+            # Вложенные сериалайзеры сами отвечают за свои ошибки
+            if isinstance(field, BaseSerializer) or not tracks_validators(field):
+                continue
+            # Сами валидаторы остаются в field.validators (их проверяют через isinstance,
+            # н-р, AutoSchema.map_field_validators), подменяется только их запуск
+            field.run_validators = partial(self.run_tracked_validators, field_name, field)
+        return fields
+
+    def run_validators(self, value):
+        """
+        Повторяет Serializer.run_validators, но через run_tracked_validators
+        """
+        if isinstance(value, dict):
+            to_validate = self._read_only_defaults()
+            to_validate.update(value)
+        else:
+            to_validate = value
+        self.run_tracked_validators(api_settings.NON_FIELD_ERRORS_KEY, self, to_validate)
+
+    def run_tracked_validators(self, field_name, field, value):
+        """
+        Повторяет Field.run_validators, но запоминает, какой именно валидатор выбросил ошибку.
+
+        Благодаря этому при построении ответа не нужно заново
+        прогонять валидаторы (и делать лишние запросы в БД в случае UniqueValidator)
+        """
+        deferred = deferred_validators.get()
+        errors = []
+        for validator in field.validators:
+            if hasattr(validator, 'set_context'):
+                validator.set_context(field)
+
+            args = (value, field) if getattr(validator, 'requires_context', False) else (value,)
+            if deferred is not None:
+                # Откладываем все валидаторы, а не только блокирующие, чтобы ошибки шли в том же порядке, что и в is_valid
+                deferred.append((self, field_name, validator, args))
+                continue
+            try:
+                call(validator, *args)
+            except ValidationError as exc:
+                self.record_error_source(field_name, exc, validator)
+                if isinstance(exc.detail, dict):
+                    raise
+                errors.extend(exc.detail)
+            except DjangoValidationError as exc:
+                self.record_error_source(field_name, exc, validator)
+                errors.extend(get_error_detail(exc))
+        if errors:
+            raise ValidationError(errors)
+
+    def record_error_source(self, field_name, exc, source):
+        detail = exc.detail if hasattr(exc, 'detail') else get_error_detail(exc)
+        # Ошибки в виде словаря разбираются по своим ключам, источник для них не запоминаем
+        if isinstance(detail, Mapping):
+            return
+        if not isinstance(detail, list):
+            detail = [detail]
+        name = get_validator_name(source)
+        sources = self._error_sources.setdefault(field_name, {})
+        for error in detail:
+            sources[(str(error), getattr(error, 'code', None))] = name
+
+    def get_error_source(self, field_name, error):
+        sources = self._error_sources.get(field_name)
+        if sources:
+            return sources.get((str(error), getattr(error, 'code', None)))
 
     def _run_validator(self, validator, field, message):
+        self._validators_rerun += 1
         try:
             validator(self.initial_data[field.field_name])
-        except (DjangoValidationError, RestValidationError) as err:
+        except (DjangoValidationError, ValidationError) as err:
             err_message = err.detail[0] if hasattr(err, 'detail') else err.message
             return err_message == message
 
@@ -59,63 +464,69 @@ class FriendlyErrorMessagesMixin:
             if self._run_validator(validator, field, message):
                 return validator
 
-    def get_field_error_entry(self, error, field):
-        field_type_mro = [klass.__name__ for klass in type(field).__mro__]
-        key = self.find_key(field, error, field.field_name)
+    def find_validator_name(self, field, error):
+        owner = field.parent
+        if isinstance(owner, FriendlyErrorMessagesMixin):
+            name = owner.get_error_source(field.field_name, error)
+            if name or tracks_validators(field):
+                return name
+
+        # Поле из обычного сериалайзера DRF или поле со своим run_validators, источник ошибки
+        # которых не запоминается, поэтому приходится перезапускать валидаторы
+        validator = self.find_validator(field, error)
+        if validator:
+            return get_validator_name(validator)
+
+    def get_field_error_entry(self, error, field, metadata=None):
+        if metadata is None:
+            metadata = build_field_metadata(field)
+        key = getattr(error, 'code', None)
 
         if key:
-            # Возможно, мы обозначили в настройках ошибки для данного класса поля,
-            # но для классов, наследующих это поле - нет
-            # Поэтому здесь если не нашли ошибки для текущего класса, попробуем найти ошибки в классов-родителей
-            for field_type in field_type_mro:
-                error_codes = settings.FRIENDLY_FIELD_ERRORS.get(field_type)
-                if error_codes:
-                    return {
-                        'code': error_codes.get(key),
-                        'field': field.field_name,
-                        'message': error,
-                        'errors': [],
-                    }
+            # Таблица кодов для класса поля (или ближайшего класса-родителя) и его child_relation строится один раз
+            code = metadata.error_codes.get(key)
+            # Если кода нет в таблице поля (н-р, 'unique'), значит ошибку выбросил валидатор
+            if code is not None:
+                return {
+                    'code': code,
+                    'field': field.field_name,
+                    'message': error,
+                    'errors': [],
+                }
 
         # Here we know that error was raised by a custom field validator
-        validator = self.find_validator(field, error)
-        if validator:
-            try:
-                name = validator.__name__
-            except AttributeError:
-                name = validator.__class__.__name__
-            code = self.FIELD_VALIDATION_ERRORS.get(name) or settings.FRIENDLY_VALIDATOR_ERRORS.get(name)
-            return {
-                'code': code,
-                'field': field.field_name,
-                'message': error,
-                'errors': [],
-            }
-        # Here we know that error was raised by custom validate method
-        # in serializer
-        validator = getattr(self, f'validate_{field.field_name}')
-        if self._run_validator(validator, field, error):
-            name = validator.__name__
-            code = self.FIELD_VALIDATION_ERRORS.get(name) or settings.FRIENDLY_VALIDATOR_ERRORS.get(name)
-            return {
-                'code': code,
-                'field': field.field_name,
-                'message': error,
-                'errors': [],
-            }
+        # or by custom validate_<field_name> method in serializer
+        name = self.find_validator_name(field, error)
+        return {
+            'code': get_validator_error_codes(type(self)).get(name) if name else None,
+            'field': field.field_name,
+            'message': error,
+            'errors': [],
+        }
 
-    def get_field_error_entries(self, errors, field):
-        return [self.get_field_error_entry(error, field) for error in errors]
+    def get_field_error_entries(self, errors, field, metadata=None):
+        if metadata is None:
+            metadata = build_field_metadata(field)
+        return [self.get_field_error_entry(error, field, metadata) for error in errors]
 
     def get_non_field_error_entry(self, error):
-        if settings.INVALID_DATA_MESSAGE.format(data_type=type(self.initial_data).__name__) == error:
-            return {
-                'code': settings.FRIENDLY_NON_FIELD_ERRORS.get('invalid'),
-                'field': None,
-                'message': error,
-                'errors': [],
-            }
-        code = self.NON_FIELD_ERRORS.get(error.code) or settings.FRIENDLY_NON_FIELD_ERRORS.get(error.code)
+        error_codes = get_non_field_error_codes(type(self))
+        error_code = getattr(error, 'code', None)
+        code = None
+        # Код 'invalid' DRF ставит всем ValidationError, у которых код не указан явно,
+        # поэтому для него сначала ищем код по сообщению
+        if error_code != ValidationError.default_code:
+            code = error_codes.get(error_code)
+        if code is None:
+            code = error_codes.get(str(error))
+        if code is None:
+            # Ошибку мог выбросить валидатор сериалайзера, н-р, UniqueTogetherValidator
+            name = self.get_error_source(api_settings.NON_FIELD_ERRORS_KEY, error)
+            if name:
+                code = self.NON_FIELD_ERRORS.get(name) or friendly_settings.FRIENDLY_VALIDATOR_ERRORS.get(name)
+        if code is None and error_code == ValidationError.default_code:
+            # Н-р, 'Invalid data. Expected a dictionary, but got str.'
+            code = error_codes.get(error_code)
         return {
             'code': code,
             'field': None,
@@ -126,44 +537,93 @@ class FriendlyErrorMessagesMixin:
     def get_non_field_error_entries(self, errors):
         return [self.get_non_field_error_entry(error) for error in errors]
 
-    def build_pretty_errors(self, errors, fields=None):
-        if not fields:
+    def iter_error_entries(self, errors, fields=None, depth=0, limit=None):
+        """
+        Генератор ошибок верхнего уровня (entries для 'errors') по мере их разбора.
+
+        Если ответ должен состоять из одной non field ошибки, генератор ничего
+        не отдает после нее и возвращает готовый ответ (StopIteration.value)
+        """
+        if fields is None:
             fields = self.fields
+        if limit is None:
+            limit = ErrorLimit()
+        # Метаданные полей общие для всех экземпляров класса, которому принадлежат fields
+        owner_class = type(getattr(fields, 'serializer', self))
 
-        pretty = []
         for error_type in errors:
-            if isinstance(errors[error_type], Mapping):
-                if hasattr(self.fields[error_type], 'fields'):
-                    fields = self.fields[error_type].fields
-                # Случай вложенных ошибок. Рекурсивно получаем вложенные ошибки
-                nested_errors = self.build_pretty_errors(errors[error_type], fields=fields)
-                pretty.append({
+            if limit.exhausted:
+                limit.truncated = True
+                break
+            field = fields.get(error_type)
+            # Вложенный FEListSerializer (many=True) сам разбирает ошибки своих элементов
+            nested_list = isinstance(field, ListSerializer) and isinstance(field, FriendlyErrorMessagesMixin)
+            if nested_list or isinstance(errors[error_type], Mapping):
+                if limit.too_deep(depth + 1):
+                    yield {
+                        'field': error_type,
+                        'code': friendly_settings.VALIDATION_FAILED_CODE,
+                        'message': self.get_validation_failed_message(),
+                        'errors': []
+                    }
+                    continue
+                if nested_list:
+                    nested_errors = field.build_pretty_errors(errors[error_type], depth=depth + 1, limit=limit)
+                else:
+                    nested_fields = fields
+                    if field is not None and get_field_metadata(owner_class, fields, error_type).nested:
+                        nested_fields = field.fields
+                    # Случай вложенных ошибок. Рекурсивно получаем вложенные ошибки
+                    nested_errors = self.build_pretty_errors(
+                        errors[error_type], fields=nested_fields, depth=depth + 1, limit=limit
+                    )
+                yield {
                     'field': error_type,
                     'code': nested_errors['code'],
                     'message': nested_errors['message'],
                     'errors': nested_errors.get('errors', [])
-                })
+                }
+            elif error_type == 'non_field_errors' and friendly_settings.AGGREGATE_NON_FIELD_ERRORS:
+                yield from self.get_non_field_error_entries(limit.take(errors[error_type]))
             elif error_type == 'non_field_errors':
                 # Решил отдавать ток 1 non field еррор, причем в формате 'code', 'message'
                 # Т.к. все равно никогда не бывает 2ух non_field_errors, да и вообще они - редкий кейс
-                error_data = self.get_non_field_error_entries(errors[error_type])[0]
+                error_data = self.get_non_field_error_entries(limit.take(errors[error_type][:1]))[0]
                 return {
-                    'code': error_data.get('code', settings.VALIDATION_FAILED_CODE),
-                    'message': error_data.get('message', settings.VALIDATION_FAILED_MESSAGE),
+                    'code': error_data.get('code', friendly_settings.VALIDATION_FAILED_CODE),
+                    'message': resolve_message(error_data.get('message', friendly_settings.VALIDATION_FAILED_MESSAGE)),
                     'errors': []
                 }
             else:
-                field = fields.get(error_type)
                 # Прокидываем ошибку напрямую в случае кастомной ошибки, вызванной разработчиком напрямую, н-р,
                 # raise ValidationError({'code': 228, 'message': 'kek'})
                 if not field:
                     break
 
-                pretty.extend(self.get_field_error_entries(errors[error_type], field))
+                yield from self.get_field_error_entries(
+                    limit.take(errors[error_type]), field, get_field_metadata(owner_class, fields, error_type)
+                )
+
+    def get_validation_failed_message(self):
+        """
+        VALIDATION_FAILED_MESSAGE на текущем языке.
+
+        Переводится один раз на валидацию, а не для каждой обертки вложенных ошибок:
+        даже поиск в кэше переводов требует get_language()
+        """
+        if self._validation_failed_message is None:
+            self._validation_failed_message = resolve_message(friendly_settings.VALIDATION_FAILED_MESSAGE)
+        return self._validation_failed_message
+
+    def build_pretty_errors(self, errors, fields=None, depth=0, limit=None):
+        pretty = []
+        summary = drain(self.iter_error_entries(errors, fields=fields, depth=depth, limit=limit), pretty)
+        if summary is not None:
+            return summary
         if pretty:
             return {
-                'code': settings.VALIDATION_FAILED_CODE,
-                'message': settings.VALIDATION_FAILED_MESSAGE,
+                'code': friendly_settings.VALIDATION_FAILED_CODE,
+                'message': self.get_validation_failed_message(),
                 'errors': pretty
             }
         # Возвращаем на клиент необработанные ошибки
@@ -0,0 +1,66 @@
+from __future__ import unicode_literals
+
+import json
+
+from django.utils.functional import Promise
+from rest_framework.compat import INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.renderers import JSONRenderer
+
+from rest_framework_friendly_errors.messages import resolve_message
+from rest_framework_friendly_errors.utils import is_pretty_data
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def get_default(encoder):
+    """
+    default для json.dumps и orjson.dumps: ленивые строки перевода (н-р, VALIDATION_FAILED_MESSAGE)
+    переводятся через кэш (resolve_message) один раз на ответ, остальное - через encoder.default.
+
+    Сами ошибки уже обычные dict/list/str, поэтому кодируются как есть
+    """
+    resolved = {}
+
+    def default(obj):
+        if isinstance(obj, Promise):
+            try:
+                return resolved[id(obj)]
+            except KeyError:
+                value = resolved[id(obj)] = resolve_message(obj)
+                return value
+        return encoder.default(obj)
+    return default
+
+
+class FriendlyJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer, который знает формат {code, message, errors: [{code, field, message, errors}]}.
+
+    Ошибки кодируются как есть, через orjson, если он установлен, ленивые строки
+    переводятся через кэш в get_default. Все остальные ответы рендерятся стандартным JSONRenderer
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, dict) or not is_pretty_data(data):
+            return super(FriendlyJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        default = get_default(self.encoder_class())
+        # orjson всегда пишет компактный UTF-8 без экранирования
+        if orjson is not None and indent is None and self.compact and not self.ensure_ascii:
+            ret = orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+            return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+        if indent is None:
+            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        else:
+            separators = INDENT_SEPARATORS
+        ret = json.dumps(
+            data, cls=self.encoder_class, default=default,
+            indent=indent, ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict, separators=separators
+        )
+        return ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
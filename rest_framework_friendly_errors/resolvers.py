@@ -0,0 +1,145 @@
+from __future__ import unicode_literals
+
+from weakref import WeakKeyDictionary
+
+from django.core.signals import setting_changed
+from rest_framework.serializers import Serializer
+
+from rest_framework_friendly_errors.settings import friendly_settings
+
+# Ключ - класс поля, значение - таблица {error_key: code}.
+# Слабые ссылки, чтобы динамически созданные сериалайзеры/поля не утекали
+_field_error_codes = WeakKeyDictionary()
+# Ключ - класс сериалайзера, значение - таблица {error_code или message: code}
+_non_field_error_codes = WeakKeyDictionary()
+# Ключ - класс сериалайзера, значение - таблица {validator_name: code}
+_validator_error_codes = WeakKeyDictionary()
+# Ключ - класс сериалайзера, значение - {field_name: FieldMetadata}
+_fields_metadata = WeakKeyDictionary()
+
+
+class FieldMetadata:
+    """
+    Все, что нужно знать о поле при разборе его ошибок, вычисляется один раз на класс сериалайзера
+    """
+    __slots__ = ('field_class', 'error_codes', 'nested', 'child_relation_class')
+
+    def __init__(self, field_class, error_codes, nested, child_relation_class):
+        self.field_class = field_class
+        self.error_codes = error_codes
+        self.nested = nested
+        self.child_relation_class = child_relation_class
+
+
+def build_field_error_codes(field_class):
+    """
+    Ищет таблицу кодов ошибок для класса поля.
+
+    Если для самого класса ошибки не обозначены в настройках,
+    берем таблицу ближайшего класса-родителя
+    """
+    for klass in field_class.__mro__:
+        error_codes = friendly_settings.FRIENDLY_FIELD_ERRORS.get(klass.__name__)
+        if error_codes:
+            return error_codes
+    return {}
+
+
+def get_field_error_codes(field_class):
+    try:
+        return _field_error_codes[field_class]
+    except KeyError:
+        error_codes = _field_error_codes[field_class] = build_field_error_codes(field_class)
+        return error_codes
+
+
+def build_non_field_error_codes(serializer_class):
+    """
+    Общая таблица non field ошибок вместе с NON_FIELD_ERRORS сериалайзера.
+
+    Ключами могут быть как коды ошибок, так и сами сообщения
+    """
+    error_codes = dict(friendly_settings.FRIENDLY_NON_FIELD_ERRORS)
+    error_codes.update(getattr(serializer_class, 'NON_FIELD_ERRORS', {}))
+    return error_codes
+
+
+def get_non_field_error_codes(serializer_class):
+    try:
+        return _non_field_error_codes[serializer_class]
+    except KeyError:
+        error_codes = _non_field_error_codes[serializer_class] = build_non_field_error_codes(serializer_class)
+        return error_codes
+
+
+def build_validator_error_codes(serializer_class):
+    """
+    Коды ошибок валидаторов: FIELD_VALIDATION_ERRORS сериалайзера поверх FRIENDLY_VALIDATOR_ERRORS
+    """
+    error_codes = dict(friendly_settings.FRIENDLY_VALIDATOR_ERRORS)
+    error_codes.update(
+        (name, code) for name, code in getattr(serializer_class, 'FIELD_VALIDATION_ERRORS', {}).items() if code
+    )
+    return error_codes
+
+
+def get_validator_error_codes(serializer_class):
+    try:
+        return _validator_error_codes[serializer_class]
+    except KeyError:
+        error_codes = _validator_error_codes[serializer_class] = build_validator_error_codes(serializer_class)
+        return error_codes
+
+
+def build_field_metadata(field):
+    child_relation = getattr(field, 'child_relation', None)
+    child_relation_class = type(child_relation) if child_relation is not None else None
+    error_codes = get_field_error_codes(type(field))
+    if child_relation_class is not None:
+        # Ошибки ManyRelatedField выбрасывает и child_relation (н-р, 'does_not_exist'),
+        # коды самого поля важнее кодов child_relation
+        error_codes = dict(get_field_error_codes(child_relation_class), **error_codes)
+    return FieldMetadata(type(field), error_codes, isinstance(field, Serializer), child_relation_class)
+
+
+def get_fields_metadata(serializer_class, fields):
+    """
+    {field_name: FieldMetadata} для класса сериалайзера, строится по полям первого экземпляра.
+
+    Поля, которых не было у первого экземпляра (н-р, get_fields зависит от context), добавляются по мере появления
+    """
+    try:
+        return _fields_metadata[serializer_class]
+    except KeyError:
+        metadata = _fields_metadata[serializer_class] = {
+            field_name: build_field_metadata(field) for field_name, field in fields.items()
+        }
+        return metadata
+
+
+def get_field_metadata(serializer_class, fields, field_name):
+    metadata = get_fields_metadata(serializer_class, fields)
+    field = fields[field_name]
+    try:
+        field_metadata = metadata[field_name]
+    except KeyError:
+        field_metadata = metadata[field_name] = build_field_metadata(field)
+    if field_metadata.field_class is not type(field):
+        # У экземпляра поле другого класса, чем у первого экземпляра - не кэшируем
+        return build_field_metadata(field)
+    return field_metadata
+
+
+def clear_error_codes():
+    _field_error_codes.clear()
+    _non_field_error_codes.clear()
+    _validator_error_codes.clear()
+    _fields_metadata.clear()
+
+
+def reload_error_codes(*args, **kwargs):
+    if kwargs['setting'] == 'FRIENDLY_ERRORS':
+        clear_error_codes()
+
+
+setting_changed.connect(reload_error_codes)
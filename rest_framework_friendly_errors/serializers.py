@@ -1,6 +1,11 @@
+from collections.abc import Mapping
+
 from rest_framework import serializers
 
+from rest_framework_friendly_errors.messages import resolve_message
+from rest_framework_friendly_errors.settings import friendly_settings
 from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+from rest_framework_friendly_errors.utils import ErrorLimit
 
 
 class FEModelSerializer(FriendlyErrorMessagesMixin, serializers.ModelSerializer):
@@ -8,7 +13,45 @@ class FEModelSerializer(FriendlyErrorMessagesMixin, serializers.ModelSerializer)
 
 
 class FEListSerializer(FriendlyErrorMessagesMixin, serializers.ListSerializer):
-    pass
+
+    def iter_error_entries(self, errors, fields=None, depth=0, limit=None):
+        if isinstance(errors, Mapping):
+            # Ошибки всего списка: передали не список, пустой список, ошибки валидаторов списка
+            return (yield from super(FEListSerializer, self).iter_error_entries(
+                errors, fields={}, depth=depth, limit=limit
+            ))
+
+        assert isinstance(self.child, FriendlyErrorMessagesMixin), (
+            'Child of `FEListSerializer` should use `FriendlyErrorMessagesMixin`'
+        )
+
+        # Для всех элементов используется один и тот же дочерний сериалайзер,
+        # поэтому поля и таблицы кодов ошибок строятся один раз на весь список
+        if limit is None:
+            limit = ErrorLimit()
+
+        for index, item_errors in enumerate(errors):
+            if not item_errors:
+                continue
+            if limit.exhausted or limit.too_deep(depth + 1):
+                limit.truncated = True
+                break
+            item_pretty = self.child.build_pretty_errors(item_errors, depth=depth + 1, limit=limit)
+            yield {
+                'field': index,
+                'code': item_pretty.get('code', friendly_settings.VALIDATION_FAILED_CODE),
+                'message': resolve_message(item_pretty.get('message', friendly_settings.VALIDATION_FAILED_MESSAGE)),
+                'errors': item_pretty.get('errors', [])
+            }
+
+    def build_pretty_errors(self, errors, fields=None, depth=0, limit=None):
+        pretty_errors = super(FEListSerializer, self).build_pretty_errors(
+            errors, fields=fields, depth=depth, limit=limit
+        )
+        # Все элементы списка валидны
+        if pretty_errors is errors and not isinstance(errors, Mapping):
+            return {}
+        return pretty_errors
 
 
 class FESerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
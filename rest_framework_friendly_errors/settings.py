@@ -1,26 +1,43 @@
 from __future__ import unicode_literals
 
+from types import MappingProxyType
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework_friendly_errors.utils import update_field_settings
 
-USER_SETTINGS = getattr(settings, 'FRIENDLY_ERRORS', {})
-
-USER_FRIENDLY_FIELD_ERRORS = USER_SETTINGS.get('FIELD_ERRORS', {})
-USER_NON_FIELD_ERRORS = USER_SETTINGS.get('NON_FIELD_ERRORS', {})
-USER_VALIDATOR_ERRORS = USER_SETTINGS.get('VALIDATOR_ERRORS', {})
-USER_EXCEPTION_DICT = USER_SETTINGS.get('EXCEPTION_DICT', {})
-
-VALIDATION_FAILED_CODE = USER_SETTINGS.get('VALIDATION_FAILED_CODE', 1000)
-VALIDATION_FAILED_MESSAGE = USER_SETTINGS.get('VALIDATION_FAILED_MESSAGE', _('Validation Failed'))
+DEFAULTS = {
+    'VALIDATION_FAILED_CODE': 1000,
+    'VALIDATION_FAILED_MESSAGE': _('Validation Failed'),
+    'CATCH_ALL_EXCEPTIONS': False,
+    # False - не вызывать str(exc) для необработанных исключений, а отдавать стандартное сообщение
+    'CATCH_ALL_EXCEPTIONS_DETAIL': True,
+    # Ограничения на размер ответа с ошибками. None - без ограничений
+    'MAX_ERRORS': None,
+    'MAX_NESTED_DEPTH': None,
+    # True - отдавать все non field ошибки вместе с ошибками полей, а не только первую из них
+    'AGGREGATE_NON_FIELD_ERRORS': False,
+    # True - замерять время форматирования ошибок и отправлять метрики (см. instrumentation.py)
+    'INSTRUMENTATION': False,
+    # Функция (или путь до нее), которая получает dict с метриками
+    'INSTRUMENTATION_CALLBACK': None,
+    # True - считать отданные коды ошибок (см. counters.py)
+    'COUNT_ERRORS': False,
+    # Размер пула потоков для сериалайзеров с CONCURRENT_VALIDATION = True
+    'MAX_VALIDATION_WORKERS': 4,
+    # True - при запуске (AppConfig.ready) построить таблицы кодов для уже импортированных сериалайзеров (см. checks.warm_up)
+    'WARM_UP': False,
+}
 
-CATCH_ALL_EXCEPTIONS = USER_SETTINGS.get(
-    'CATCH_ALL_EXCEPTIONS',
-    False
+# Настройки, которые могут быть заданы строкой с путем для импорта
+IMPORT_STRINGS = (
+    'INSTRUMENTATION_CALLBACK',
 )
 
-FRIENDLY_FIELD_ERRORS = {
+DEFAULT_FIELD_ERRORS = {
     'BooleanField': {
         'required': 2001,
         'invalid': 2011,
@@ -258,20 +275,13 @@ FRIENDLY_FIELD_ERRORS = {
     }
 }
 
-FRIENDLY_FIELD_ERRORS = update_field_settings(
-    FRIENDLY_FIELD_ERRORS,
-    USER_FRIENDLY_FIELD_ERRORS
-)
-
 INVALID_DATA_MESSAGE = 'Invalid data. Expected a dictionary, but got {data_type}.'
 
-FRIENDLY_NON_FIELD_ERRORS = {
+DEFAULT_NON_FIELD_ERRORS = {
     'invalid': 1001
 }
 
-FRIENDLY_NON_FIELD_ERRORS.update(USER_NON_FIELD_ERRORS)
-
-FRIENDLY_VALIDATOR_ERRORS = {
+DEFAULT_VALIDATOR_ERRORS = {
     'UniqueValidator': 3001,
     'UniqueTogetherValidator': 3003,
     'UniqueForDateValidator': 3004,
@@ -294,9 +304,7 @@ FRIENDLY_VALIDATOR_ERRORS = {
     'int_list_validator': 3020,
 }
 
-FRIENDLY_VALIDATOR_ERRORS.update(USER_VALIDATOR_ERRORS)
-
-FRIENDLY_EXCEPTION_DICT = {
+DEFAULT_EXCEPTION_DICT = {
     'APIException': 4000,
     'ParseError': 4001,
     'AuthenticationFailed': 4002,
@@ -308,4 +316,84 @@ FRIENDLY_EXCEPTION_DICT = {
     'UnsupportedMediaType': 4008,
     'Throttled': 4009
 }
-FRIENDLY_EXCEPTION_DICT.update(USER_EXCEPTION_DICT)
+
+
+def build_table(default, user_table):
+    table = dict(default)
+    table.update(user_table)
+    return MappingProxyType(table)
+
+
+def build_field_table(default, user_table):
+    table = update_field_settings({field: dict(codes) for field, codes in default.items()}, user_table)
+    return MappingProxyType({field: MappingProxyType(codes) for field, codes in table.items()})
+
+
+# Таблицы кодов ошибок: имя атрибута -> (ключ в FRIENDLY_ERRORS, таблица по умолчанию, сборщик)
+TABLES = {
+    'FRIENDLY_FIELD_ERRORS': ('FIELD_ERRORS', DEFAULT_FIELD_ERRORS, build_field_table),
+    'FRIENDLY_NON_FIELD_ERRORS': ('NON_FIELD_ERRORS', DEFAULT_NON_FIELD_ERRORS, build_table),
+    'FRIENDLY_VALIDATOR_ERRORS': ('VALIDATOR_ERRORS', DEFAULT_VALIDATOR_ERRORS, build_table),
+    'FRIENDLY_EXCEPTION_DICT': ('EXCEPTION_DICT', DEFAULT_EXCEPTION_DICT, build_table),
+}
+
+
+class FriendlyErrorsSettings:
+    """
+    Настройки FRIENDLY_ERRORS, по аналогии с api_settings из DRF.
+
+    Значения и таблицы кодов строятся при первом обращении и сохраняются
+    как атрибуты объекта, поэтому дальше чтение настройки - обычное обращение к атрибуту.
+    При изменении FRIENDLY_ERRORS (н-р, override_settings в тестах) настройки перестраиваются
+    """
+
+    def __init__(self, user_settings=None):
+        if user_settings is not None:
+            self._user_settings = user_settings
+        self._cached_attrs = set()
+
+    @property
+    def user_settings(self):
+        if not hasattr(self, '_user_settings'):
+            self._user_settings = getattr(settings, 'FRIENDLY_ERRORS', {})
+        return self._user_settings
+
+    def __getattr__(self, attr):
+        if attr in DEFAULTS:
+            value = self.user_settings.get(attr, DEFAULTS[attr])
+            if attr in IMPORT_STRINGS and isinstance(value, str):
+                value = import_string(value)
+        elif attr in TABLES:
+            user_key, default, build = TABLES[attr]
+            value = build(default, self.user_settings.get(user_key, {}))
+        elif attr == 'INVALID_DATA_MESSAGE':
+            value = INVALID_DATA_MESSAGE
+        else:
+            raise AttributeError("Invalid FRIENDLY_ERRORS setting: '%s'" % attr)
+
+        self._cached_attrs.add(attr)
+        setattr(self, attr, value)
+        return value
+
+    def reload(self):
+        for attr in self._cached_attrs:
+            delattr(self, attr)
+        self._cached_attrs.clear()
+        if hasattr(self, '_user_settings'):
+            delattr(self, '_user_settings')
+
+
+friendly_settings = FriendlyErrorsSettings()
+
+
+def reload_friendly_settings(*args, **kwargs):
+    if kwargs['setting'] == 'FRIENDLY_ERRORS':
+        friendly_settings.reload()
+
+
+setting_changed.connect(reload_friendly_settings)
+
+
+def __getattr__(name):
+    # Обратная совместимость: settings.FRIENDLY_FIELD_ERRORS и т.д.
+    return getattr(friendly_settings, name)
@@ -0,0 +1,130 @@
+from __future__ import unicode_literals
+
+from collections.abc import Mapping
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+from rest_framework_friendly_errors.counters import error_counters
+from rest_framework_friendly_errors.messages import resolve_message
+from rest_framework_friendly_errors.renderers import get_default
+from rest_framework_friendly_errors.settings import friendly_settings
+from rest_framework_friendly_errors.utils import ErrorLimit, count_errors
+
+
+class StreamingErrorsRenderer:
+    """
+    Рендерит ошибки сериалайзера в JSON по частям, не собирая весь ответ в памяти.
+
+    Ошибки разбираются генератором iter_error_entries по мере записи ответа,
+    поэтому для bulk запросов память не зависит от количества невалидных элементов.
+    Формат тот же, что и у serializer.errors
+    """
+    media_type = 'application/json'
+    charset = 'utf-8'
+    encoder_class = encoders.JSONEncoder
+    # Размер части ответа, которую отдаем в StreamingHttpResponse
+    chunk_size = 64 * 1024
+    # Сколько ошибок верхнего уровня кодируется за раз
+    batch_size = 100
+
+    def get_encoder(self):
+        return self.encoder_class(
+            default=get_default(self.encoder_class()),
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=SHORT_SEPARATORS if api_settings.COMPACT_JSON else LONG_SEPARATORS,
+        )
+
+    def is_streamable(self, errors):
+        # Ответ из одной non field ошибки и ошибки всего списка маленькие, их отдаем целиком
+        if isinstance(errors, Mapping):
+            return 'non_field_errors' not in errors or friendly_settings.AGGREGATE_NON_FIELD_ERRORS
+        return True
+
+    def iter_render(self, serializer):
+        for chunk in self.iter_buffered(self.iter_json(serializer)):
+            # Аналогично JSONRenderer из DRF
+            yield chunk.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode(self.charset)
+
+    def iter_buffered(self, parts):
+        buffer = []
+        size = 0
+        for part in parts:
+            buffer.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield ''.join(buffer)
+
+    def iter_json(self, serializer):
+        assert hasattr(serializer, '_errors'), 'You must call `.is_valid()` before rendering errors.'
+
+        encoder = self.get_encoder()
+        errors = serializer._errors
+        if not errors or not self.is_streamable(errors):
+            yield encoder.encode(serializer.errors)
+            return
+
+        limit = ErrorLimit(friendly_settings.MAX_ERRORS, friendly_settings.MAX_NESTED_DEPTH)
+        entries = serializer.iter_error_entries(errors, limit=limit)
+        entry = next(entries, None)
+        if entry is None:
+            # Ошибки не удалось разобрать (кастомные ошибки разработчика)
+            yield encoder.encode(serializer.errors)
+            return
+
+        # '{"code": 1000, "message": "Validation Failed", "errors": []}' без ']}' в конце
+        yield encoder.encode({
+            'code': friendly_settings.VALIDATION_FAILED_CODE,
+            'message': resolve_message(friendly_settings.VALIDATION_FAILED_MESSAGE),
+            'errors': [],
+        })[:-2]
+
+        # Ошибки кодируются пачками по batch_size, это сильно быстрее, чем по одной
+        count = friendly_settings.COUNT_ERRORS
+        batch = [entry]
+        separator = ''
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= self.batch_size:
+                if count:
+                    error_counters.count_entry_list(batch)
+                yield separator + encoder.encode(batch)[1:-1]
+                batch = []
+                separator = encoder.item_separator
+        if batch:
+            if count:
+                error_counters.count_entry_list(batch)
+            yield separator + encoder.encode(batch)[1:-1]
+        yield ']'
+
+        if limit.truncated:
+            # ', "truncated": true, "total": N}'
+            yield encoder.item_separator + encoder.encode({
+                'truncated': True,
+                'total': count_errors(errors),
+            })[1:]
+        else:
+            yield '}'
+
+
+def streaming_errors_response(serializer, status_code=status.HTTP_400_BAD_REQUEST, renderer=None):
+    """
+    StreamingHttpResponse с ошибками невалидного сериалайзера, н-р, для bulk create:
+
+        if not serializer.is_valid():
+            return streaming_errors_response(serializer)
+    """
+    renderer = renderer or StreamingErrorsRenderer()
+    return StreamingHttpResponse(
+        renderer.iter_render(serializer),
+        status=status_code,
+        content_type='%s; charset=%s' % (renderer.media_type, renderer.charset),
+    )
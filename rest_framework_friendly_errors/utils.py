@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import asyncio
+
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import get_error_detail
@@ -18,7 +20,10 @@ def update_field_settings(setting, user_setting):
 
 
 def is_pretty(response):
-    data = response.data
+    return is_pretty_data(response.data)
+
+
+def is_pretty_data(data):
     return'message' in data and 'code' in data and isinstance(data, dict) and isinstance(data.get('errors'), list)
 
 
@@ -31,6 +36,71 @@ def get_int_value(value, default=None):
         return value
 
 
+def count_errors(errors):
+    if isinstance(errors, dict):
+        return sum(count_errors(value) for value in errors.values())
+    if isinstance(errors, list):
+        return sum(count_errors(value) for value in errors)
+    return 1
+
+
+class ErrorLimit:
+    """
+    Ограничение количества ошибок и глубины вложенности при построении ответа.
+
+    Один объект передается во все рекурсивные вызовы build_pretty_errors
+    """
+
+    def __init__(self, max_errors=None, max_depth=None):
+        self.max_errors = max_errors
+        self.max_depth = max_depth
+        self.count = 0
+        # Максимальная глубина вложенности, до которой дошел обход
+        self.depth = 0
+        self.truncated = False
+
+    @property
+    def exhausted(self):
+        return self.max_errors is not None and self.count >= self.max_errors
+
+    def take(self, errors):
+        if self.max_errors is not None and len(errors) > self.max_errors - self.count:
+            errors = errors[:self.max_errors - self.count]
+            self.truncated = True
+        self.count += len(errors)
+        return errors
+
+    def too_deep(self, depth):
+        if self.max_depth is not None and depth > self.max_depth:
+            self.truncated = True
+            return True
+        if depth > self.depth:
+            self.depth = depth
+        return False
+
+
+def drain(generator, items):
+    """
+    Складывает значения генератора в items и возвращает то, что генератор вернул через return
+    """
+    while True:
+        try:
+            items.append(next(generator))
+        except StopIteration as stop:
+            return stop.value
+
+
+def is_async_callable(func):
+    return asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(getattr(func, '__call__', None))
+
+
+def get_validator_name(validator):
+    try:
+        return validator.__name__
+    except AttributeError:
+        return validator.__class__.__name__
+
+
 def as_serializer_error(exc):
     """
     Продублировал аналогичную функцию из DRF за исключением того,
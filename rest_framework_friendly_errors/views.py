@@ -0,0 +1,16 @@
+from __future__ import unicode_literals
+
+from django.http import HttpResponse
+
+from rest_framework_friendly_errors.counters import render_prometheus
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def error_counters_view(request):
+    """
+    Отдает счетчики ошибок (COUNT_ERRORS) в формате Prometheus.
+
+    Доступ к view нужно ограничивать самостоятельно
+    """
+    return HttpResponse(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
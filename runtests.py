@@ -49,6 +49,15 @@ def is_class(string):
 
 
 if __name__ == "__main__":
+    try:
+        sys.argv.remove('--bench')
+    except ValueError:
+        pass
+    else:
+        # `runtests.py --bench [--save FILE] [--compare FILE]`
+        from tests.benchmarks import main as benchmarks_main
+        sys.exit(benchmarks_main(sys.argv[1:]))
+
     try:
         sys.argv.remove('--nolint')
     except ValueError:
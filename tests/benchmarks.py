@@ -0,0 +1,286 @@
+"""
+Microbenchmarks for the error pipeline.
+
+    $ python runtests.py --bench
+    $ python runtests.py --bench --save baseline.json
+    $ python runtests.py --bench --compare baseline.json
+
+Every case validates its payload once and then times only error formatting:
+`FriendlyErrorMessagesMixin.errors`, `build_pretty_errors`,
+`friendly_exception_handler`, `transform_response_data_values`,
+`JSONRenderer`/`FriendlyJSONRenderer` and `StreamingErrorsRenderer`.
+Import time of the package is measured with `python -X importtime`.
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import copy
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Number of fields / nesting levels / items for every payload
+SIZES = {
+    'flat': 1,
+    'wide': 500,
+    'deep': 20,
+    'bulk': 10000,
+}
+
+# Slowdown (ops/sec ratio) reported as regression in `--compare` mode
+REGRESSION_THRESHOLD = 0.8
+
+
+def setup_django():
+    from django.conf import settings
+
+    if not settings.configured:
+        from tests.conftest import pytest_configure
+        pytest_configure()
+
+    from django.core.management import call_command
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+def get_snippet_data():
+    from tests import BaseTestCase
+
+    case = BaseTestCase()
+    case.setUp()
+    return case.data_set
+
+
+def make_flat_serializer(size):
+    from tests.serializers import SnippetSerializer
+
+    data = dict(get_snippet_data(), linenos='A text instead of a bool',
+                title='Too Long Title For Defined Serializer', rating='text instead of float')
+    return SnippetSerializer(data=data)
+
+
+def make_wide_serializer(size):
+    from rest_framework import serializers
+
+    from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+
+    fields = {'field_%s' % index: serializers.IntegerField() for index in range(size)}
+    serializer_class = type('WideSerializer', (FriendlyErrorMessagesMixin, serializers.Serializer), fields)
+    return serializer_class(data={name: 'not a number' for name in fields})
+
+
+def make_deep_serializer(size):
+    from rest_framework import serializers
+
+    from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+
+    serializer_class = type('DeepSerializer0', (FriendlyErrorMessagesMixin, serializers.Serializer), {
+        'value': serializers.IntegerField(),
+    })
+    data = {'value': 'not a number'}
+    for level in range(1, size):
+        serializer_class = type('DeepSerializer%s' % level, (FriendlyErrorMessagesMixin, serializers.Serializer), {
+            'value': serializers.IntegerField(),
+            'child': serializer_class(),
+        })
+        data = {'value': 'not a number', 'child': data}
+    return serializer_class(data=data)
+
+
+def make_bulk_serializer(size):
+    from rest_framework_friendly_errors.serializers import FEListSerializer
+    from tests.serializers import SnippetSerializer
+
+    class BulkSnippetSerializer(SnippetSerializer):
+        class Meta:
+            list_serializer_class = FEListSerializer
+
+    data = dict(get_snippet_data(), linenos='A text instead of a bool')
+    return BulkSnippetSerializer(data=[data] * size, many=True)
+
+
+CASES = {
+    'flat': make_flat_serializer,
+    'wide': make_wide_serializer,
+    'deep': make_deep_serializer,
+    'bulk': make_bulk_serializer,
+}
+
+
+def measure(func, prepare=None, min_time=0.2):
+    """
+    Runs `func(prepare())` until `min_time` passes, `prepare` is not timed.
+
+    Returns ops/sec and peak memory (KiB) allocated by a single run
+    """
+    args = prepare() if prepare else None
+    tracemalloc.start()
+    func(args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    runs = 0
+    elapsed = 0.0
+    while runs == 0 or elapsed < min_time:
+        args = prepare() if prepare else None
+        started = time.perf_counter()
+        func(args)
+        elapsed += time.perf_counter() - started
+        runs += 1
+    return {
+        'ops_per_sec': runs / elapsed,
+        'peak_kib': peak / 1024.0,
+    }
+
+
+def run_case(name, size, min_time=0.2):
+    from rest_framework.exceptions import ValidationError
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.response import Response
+
+    from rest_framework_friendly_errors.exceptions import FriendlyValidationError
+    from rest_framework_friendly_errors.handlers import (friendly_exception_handler,
+                                                         transform_response_data_values)
+    from rest_framework_friendly_errors.renderers import FriendlyJSONRenderer
+    from rest_framework_friendly_errors.streaming import StreamingErrorsRenderer
+
+    serializer = CASES[name](size)
+    assert not serializer.is_valid()
+    ugly_errors = serializer._errors
+    pretty_errors = serializer.errors
+    raw_detail = ValidationError(dict(pretty_errors)).detail
+
+    def read_errors(args):
+        serializer._pretty_errors = None
+        return serializer.errors
+
+    results = {
+        'errors': measure(read_errors, min_time=min_time),
+        'build_pretty_errors': measure(
+            lambda args: serializer.build_pretty_errors(ugly_errors), min_time=min_time
+        ),
+        'json_render': measure(lambda args: JSONRenderer().render(pretty_errors), min_time=min_time),
+        'friendly_json_render': measure(
+            lambda args: FriendlyJSONRenderer().render(pretty_errors), min_time=min_time
+        ),
+        'streaming_render': measure(
+            lambda args: collections.deque(StreamingErrorsRenderer().iter_render(serializer), maxlen=0),
+            min_time=min_time
+        ),
+        'friendly_exception_handler': measure(
+            lambda exc: friendly_exception_handler(exc, {}),
+            prepare=lambda: FriendlyValidationError(pretty_errors),
+            min_time=min_time
+        ),
+        'friendly_exception_handler (raw)': measure(
+            lambda exc: friendly_exception_handler(exc, {}),
+            prepare=lambda: ValidationError(copy.deepcopy(raw_detail)),
+            min_time=min_time
+        ),
+        'transform_response_data_values': measure(
+            transform_response_data_values,
+            prepare=lambda: Response(copy.deepcopy(raw_detail)),
+            min_time=min_time
+        ),
+    }
+    return {'%s.%s' % (name, key): value for key, value in results.items()}
+
+
+# Django and DRF are imported before the measured module, so only the package's own cost is reported
+IMPORT_SCRIPT = """
+import gc
+import sys
+
+gc.disable()
+from django.conf import settings
+settings.configure()
+import django
+django.setup()
+import rest_framework.serializers
+import rest_framework.views
+sys.stderr.write('%s\\n')
+import %s
+"""
+IMPORT_MARKER = '-- measured import --'
+
+
+def measure_import_time(module='rest_framework_friendly_errors.mixins'):
+    """
+    Runs `python -X importtime` in a fresh interpreter.
+
+    Returns {module name: self time in microseconds} for modules imported by `module`
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SCRIPT % (IMPORT_MARKER, module)],
+        cwd=root, stderr=subprocess.PIPE, universal_newlines=True, check=True
+    ).stderr
+    import_times = collections.OrderedDict()
+    for line in output.split(IMPORT_MARKER, 1)[1].splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        import_times[name.strip()] = int(self_time)
+    return import_times
+
+
+def run_benchmarks(sizes=None, min_time=0.2):
+    sizes = sizes or SIZES
+    results = {}
+    for name, size in sizes.items():
+        results.update(run_case(name, size, min_time=min_time))
+    return results
+
+
+def compare(results, baseline):
+    regressions = []
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            continue
+        ratio = result['ops_per_sec'] / baseline[key]['ops_per_sec']
+        if ratio < REGRESSION_THRESHOLD:
+            regressions.append(key)
+        print('%-55s %8.2fx' % (key, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', help='save results as JSON baseline')
+    parser.add_argument('--compare', help='compare results with JSON baseline')
+    parser.add_argument('--min-time', type=float, default=0.2, help='min seconds per benchmark')
+    args = parser.parse_args(argv)
+
+    setup_django()
+    results = run_benchmarks(min_time=args.min_time)
+
+    print('%-55s %12s %12s' % ('benchmark', 'ops/sec', 'peak KiB'))
+    for key, result in sorted(results.items()):
+        print('%-55s %12.2f %12.1f' % (key, result['ops_per_sec'], result['peak_kib']))
+
+    import_times = measure_import_time()
+    print('\n%-55s %12s' % ('import', 'self us'))
+    for module, self_time in import_times.items():
+        print('%-55s %12d' % (module, self_time))
+    print('%-55s %12d' % ('total', sum(import_times.values())))
+
+    if args.save:
+        with open(args.save, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        print('\nCompared to %s (ops/sec ratio):' % args.compare)
+        regressions = compare(results, baseline)
+        if regressions:
+            print('Regressions: %s' % ', '.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -22,6 +22,7 @@ def pytest_configure():
 
             'tests',
             'rest_framework',
+            'rest_framework_friendly_errors',
         ),
         PASSWORD_HASHERS=(
             'django.contrib.auth.hashers.MD5PasswordHasher',
@@ -22,3 +22,8 @@ def method_not_allowed(request):
 @permission_classes((IsAuthenticated,))
 def not_authenticated(request):
     pass
+
+
+@api_view(['GET'])
+def unknown_error(request):
+    raise ValueError('Unknown error')
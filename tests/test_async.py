@@ -0,0 +1,126 @@
+from asgiref.sync import async_to_sync
+from django.utils.asyncio import async_unsafe
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from rest_framework_friendly_errors.exceptions import FriendlyValidationError
+from rest_framework_friendly_errors.handlers import friendly_exception_handler
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+async def is_not_taken(value):
+    if value.startswith('taken'):
+        raise ValidationError('Name is taken')
+
+
+class UsedValueValidator:
+    """
+    Validator with `queryset` (like UniqueValidator) is run through sync_to_async in async mode
+    """
+    queryset = ['used']
+
+    def __call__(self, value):
+        if value in self.queryset:
+            raise ValidationError('Value is already used', code='unique')
+
+
+@async_unsafe('is_not_banned')
+def is_not_banned(value):
+    # Like an ORM query: raises SynchronousOnlyOperation when called from the event loop
+    if value == 'banned':
+        raise ValidationError('Value is banned')
+
+
+class OrmFieldSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    name = serializers.CharField(max_length=10, validators=[is_not_banned])
+
+    FIELD_VALIDATION_ERRORS = {'is_not_banned': 5203}
+
+
+class AsyncSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    name = serializers.CharField(max_length=10, validators=[is_not_taken])
+    comment = serializers.CharField()
+    watermark = serializers.CharField(validators=[UsedValueValidator()])
+
+    FIELD_VALIDATION_ERRORS = {'is_not_taken': 5200, 'validate_comment': 5201, 'UsedValueValidator': 5202}
+    NON_FIELD_ERRORS = {'Name and comment must differ': 8200}
+
+    async def validate_comment(self, value):
+        if not value[0].isupper():
+            raise ValidationError('First letter must be an uppercase')
+        return value
+
+    async def validate(self, attrs):
+        if attrs['name'] == attrs['comment']:
+            raise ValidationError('Name and comment must differ')
+        return attrs
+
+
+def ais_valid(serializer, raise_exception=False):
+    return async_to_sync(serializer.ais_valid)(raise_exception=raise_exception)
+
+
+class AsyncValidationTestCase(BaseTestCase):
+
+    def test_valid(self):
+        serializer = AsyncSerializer(data={'name': 'name', 'comment': 'Comment', 'watermark': 'new'})
+        self.assertTrue(ais_valid(serializer))
+        self.assertEqual(serializer.validated_data['comment'], 'Comment')
+
+    def test_async_validators(self):
+        serializer = AsyncSerializer(data={'name': 'taken', 'comment': 'comment', 'watermark': 'used'})
+        self.assertFalse(ais_valid(serializer))
+
+        errors = {error['field']: error['code'] for error in serializer.errors['errors']}
+        self.assertEqual(errors, {'name': 5200, 'comment': 5201, 'watermark': 5202})
+
+    def test_sync_and_deferred_errors_are_collected(self):
+        data = {'name': 'taken' * 3, 'comment': 'Comment', 'watermark': 'new'}
+        serializer = AsyncSerializer(data=data)
+        self.assertFalse(ais_valid(serializer))
+        self.assertEqual([error['code'] for error in serializer.errors['errors']], [5200, 2041])
+
+        # Same order as in is_valid: the order of field.validators
+        sync_serializer = AsyncSerializer(data=data)
+        self.assertFalse(sync_serializer.is_valid())
+        self.assertEqual(serializer.errors, sync_serializer.errors)
+
+    def test_sync_validators_are_run_outside_event_loop(self):
+        serializer = OrmFieldSerializer(data={'name': 'banned'})
+        self.assertFalse(ais_valid(serializer))
+        self.assertEqual(serializer.errors['errors'][0]['code'], 5203)
+
+        self.assertTrue(ais_valid(OrmFieldSerializer(data={'name': 'name'})))
+
+    def test_async_validate(self):
+        serializer = AsyncSerializer(data={'name': 'Same', 'comment': 'Same', 'watermark': 'new'})
+        self.assertFalse(ais_valid(serializer))
+        self.assertEqual(serializer.errors['code'], 8200)
+
+    def test_raise_exception(self):
+        serializer = AsyncSerializer(data={'name': 'taken', 'comment': 'Comment', 'watermark': 'new'})
+        with self.assertRaises(FriendlyValidationError) as context:
+            ais_valid(serializer, raise_exception=True)
+
+        response = friendly_exception_handler(context.exception, {})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'][0]['code'], 5200)
+
+    def test_sync_serializer(self):
+        self.data_set['comment'] = 'comment'
+        serializer = SnippetSerializer(data=self.data_set)
+        self.assertFalse(ais_valid(serializer))
+        self.assertEqual(serializer.errors['errors'][0]['code'], 5000)
+
+    def test_async_validator_in_sync_path(self):
+        serializer = AsyncSerializer(data={'name': 'taken', 'comment': 'Comment', 'watermark': 'new'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors['errors'][0]['code'], 5200)
+
+    def test_async_methods_in_sync_path(self):
+        serializer = AsyncSerializer(data={'name': 'Same', 'comment': 'Same', 'watermark': 'new'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors['code'], 8200)
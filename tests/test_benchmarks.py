@@ -0,0 +1,18 @@
+from tests import BaseTestCase
+from tests.benchmarks import CASES, compare, run_benchmarks
+
+
+class BenchmarksTestCase(BaseTestCase):
+
+    def test_benchmarks_run(self):
+        results = run_benchmarks(sizes={name: 2 for name in CASES}, min_time=0)
+        self.assertIn('bulk.errors', results)
+        self.assertIn('wide.transform_response_data_values', results)
+        for result in results.values():
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreaterEqual(result['peak_kib'], 0)
+
+    def test_compare(self):
+        baseline = {'flat.errors': {'ops_per_sec': 100.0}, 'flat.build_pretty_errors': {'ops_per_sec': 100.0}}
+        results = {'flat.errors': {'ops_per_sec': 50.0}, 'flat.build_pretty_errors': {'ops_per_sec': 110.0}}
+        self.assertEqual(compare(results, baseline), ['flat.errors'])
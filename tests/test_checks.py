@@ -0,0 +1,105 @@
+from unittest import mock
+
+from django.apps import apps
+from django.test import override_settings
+from rest_framework import serializers
+
+from rest_framework_friendly_errors.checks import (check_error_codes, check_serializer, get_serializer_classes,
+                                                   warm_up)
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+from rest_framework_friendly_errors.resolvers import (_fields_metadata, _non_field_error_codes,
+                                                      _validator_error_codes, clear_error_codes)
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+class UnknownField(serializers.Field):
+    pass
+
+
+class MisconfiguredSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    FIELD_VALIDATION_ERRORS = {'validate_title': None}
+
+    title = serializers.CharField()
+    unknown = UnknownField()
+
+
+def get_ids(errors):
+    return [error.id for error in errors]
+
+
+class ErrorCodesCheckTestCase(BaseTestCase):
+
+    def test_default_settings(self):
+        self.assertEqual(check_error_codes([apps.get_app_config('auth')]), [])
+
+    @override_settings(FRIENDLY_ERRORS={'FIELD_ERRORS': {'ChairField': {'blank': 2100}}})
+    def test_unknown_field_class(self):
+        errors = check_error_codes([apps.get_app_config('auth')])
+        self.assertEqual(get_ids(errors), ['rest_framework_friendly_errors.W001'])
+        self.assertIn('ChairField', errors[0].msg)
+
+    @override_settings(FRIENDLY_ERRORS={'FIELD_ERRORS': {'CharField': {'blank': None}}})
+    def test_missing_code(self):
+        errors = check_error_codes([apps.get_app_config('auth')])
+        self.assertEqual(get_ids(errors), ['rest_framework_friendly_errors.W002'])
+        self.assertIn('CharField.blank', errors[0].msg)
+
+    @override_settings(FRIENDLY_ERRORS={'EXCEPTION_DICT': {'NotFound': 3001}})
+    def test_conflicting_codes(self):
+        errors = check_error_codes([apps.get_app_config('auth')])
+        self.assertEqual(get_ids(errors), ['rest_framework_friendly_errors.W003'])
+        self.assertIn('UniqueValidator', errors[0].msg)
+        self.assertIn('NotFound', errors[0].msg)
+
+    @override_settings(FRIENDLY_ERRORS={'FIELD_ERRORS': {'CharField': {'required': 2013}}})
+    def test_conflicting_codes_in_field_errors(self):
+        errors = check_error_codes([apps.get_app_config('auth')])
+        self.assertEqual(get_ids(errors), ['rest_framework_friendly_errors.W003'])
+        self.assertIn("'CharField.required' in FIELD_ERRORS", errors[0].msg)
+        self.assertIn("'IntegerField.invalid' in FIELD_ERRORS", errors[0].msg)
+
+    @override_settings(FRIENDLY_ERRORS={'NON_FIELD_ERRORS': {'UniqueValidator': 3001}})
+    def test_same_error_in_two_tables(self):
+        self.assertEqual(check_error_codes([apps.get_app_config('auth')]), [])
+
+    def test_serializer(self):
+        errors = check_serializer(MisconfiguredSerializer)
+        self.assertEqual(get_ids(errors), ['rest_framework_friendly_errors.W002', 'rest_framework_friendly_errors.W004'])
+        self.assertIs(errors[0].obj, MisconfiguredSerializer)
+        self.assertIn('UnknownField', errors[1].msg)
+
+    def test_serializer_classes_of_apps(self):
+        serializer_classes = get_serializer_classes([apps.get_app_config('tests')])
+        self.assertIn(SnippetSerializer, serializer_classes)
+        self.assertNotIn(MisconfiguredSerializer, get_serializer_classes([apps.get_app_config('auth')]))
+
+
+class WarmUpTestCase(BaseTestCase):
+
+    def tearDown(self):
+        clear_error_codes()
+
+    def test_warm_up(self):
+        clear_error_codes()
+        warm_up()
+
+        self.assertIn(SnippetSerializer, _non_field_error_codes)
+        self.assertIn(SnippetSerializer, _validator_error_codes)
+        self.assertEqual(set(_fields_metadata[SnippetSerializer]), set(SnippetSerializer._declared_fields))
+
+    def test_no_warm_up_by_default(self):
+        with mock.patch('rest_framework_friendly_errors.checks.warm_up') as warm_up_mock:
+            apps.get_app_config('rest_framework_friendly_errors').ready()
+        warm_up_mock.assert_not_called()
+
+    @override_settings(FRIENDLY_ERRORS={'WARM_UP': True})
+    def test_warm_up_on_ready(self):
+        clear_error_codes()
+        with mock.patch('rest_framework_friendly_errors.checks.import_serializers') as import_serializers:
+            apps.get_app_config('rest_framework_friendly_errors').ready()
+        import_serializers.assert_not_called()
+
+        self.assertIn(SnippetSerializer, _non_field_error_codes)
+        self.assertIn(SnippetSerializer, _validator_error_codes)
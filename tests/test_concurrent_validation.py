@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+from asgiref.sync import async_to_sync
+from django.db import transaction
+from django.test import SimpleTestCase, override_settings
+from django.utils import translation
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from rest_framework_friendly_errors.executor import shutdown_executor
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+
+
+class BarrierValidator:
+    """
+    Passes only if `parties` validators are run at the same time
+    """
+
+    def __init__(self, barrier, delay=0):
+        self.barrier = barrier
+        self.delay = delay
+
+    def __call__(self, value):
+        self.barrier.wait()
+        time.sleep(self.delay)
+        raise ValidationError('Invalid value')
+
+
+def make_concurrent_serializer(delays):
+    barrier = threading.Barrier(len(delays), timeout=5)
+    fields = {
+        'field_%s' % index: serializers.CharField(validators=[BarrierValidator(barrier, delay)])
+        for index, delay in enumerate(delays)
+    }
+    fields.update(CONCURRENT_VALIDATION=True, FIELD_VALIDATION_ERRORS={'BarrierValidator': 5300})
+    return type('ConcurrentSerializer', (FriendlyErrorMessagesMixin, serializers.Serializer), fields)
+
+
+class ConcurrentValidationTestCase(SimpleTestCase):
+    # Not TestCase: fields are validated sequentially inside its transaction
+    databases = {'default'}
+
+    def tearDown(self):
+        shutdown_executor()
+
+    def test_fields_are_validated_concurrently(self):
+        serializer_class = make_concurrent_serializer([0, 0, 0])
+        serializer = serializer_class(data={'field_0': 'a', 'field_1': 'b', 'field_2': 'c'})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['code'] for error in serializer.errors['errors']], [5300] * 3)
+
+    def test_errors_keep_field_order(self):
+        serializer_class = make_concurrent_serializer([0.05, 0.02, 0])
+        serializer = serializer_class(data={'field_0': 'a', 'field_1': 'b', 'field_2': 'c'})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']],
+                         ['field_0', 'field_1', 'field_2'])
+
+    @override_settings(FRIENDLY_ERRORS={'MAX_VALIDATION_WORKERS': 1})
+    def test_nested_serializers_do_not_wait_for_pool(self):
+        class ChildSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            CONCURRENT_VALIDATION = True
+            value = serializers.IntegerField()
+
+        class ParentSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            CONCURRENT_VALIDATION = True
+            first = ChildSerializer()
+            second = ChildSerializer()
+
+        serializer = ParentSerializer(data={'first': {'value': 'a'}, 'second': {'value': 1}})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors['errors'][0]['field'], 'first')
+        self.assertEqual(serializer.errors['errors'][0]['errors'][0]['code'], 2013)
+
+    def test_active_language_is_kept(self):
+        class TranslatedSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            value = serializers.IntegerField()
+
+        class ConcurrentTranslatedSerializer(TranslatedSerializer):
+            CONCURRENT_VALIDATION = True
+
+        with translation.override('de'):
+            sequential = TranslatedSerializer(data={'value': 'x'})
+            concurrent = ConcurrentTranslatedSerializer(data={'value': 'x'})
+            self.assertFalse(sequential.is_valid())
+            self.assertFalse(concurrent.is_valid())
+
+        self.assertNotEqual(sequential.errors['errors'][0]['message'], 'A valid integer is required.')
+        self.assertEqual(concurrent.errors['errors'][0]['message'], sequential.errors['errors'][0]['message'])
+
+    def test_sequential_in_atomic_block(self):
+        threads = []
+
+        def record_thread(value):
+            threads.append(threading.current_thread())
+
+        class AtomicSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            CONCURRENT_VALIDATION = True
+
+            first = serializers.CharField(validators=[record_thread])
+            second = serializers.CharField(validators=[record_thread])
+
+        with transaction.atomic():
+            self.assertTrue(AtomicSerializer(data={'first': 'a', 'second': 'b'}).is_valid())
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+
+        threads.clear()
+        self.assertTrue(AtomicSerializer(data={'first': 'a', 'second': 'b'}).is_valid())
+        self.assertNotIn(threading.current_thread(), threads)
+
+
+class AsyncConcurrentValidationTestCase(SimpleTestCase):
+
+    def test_fields_are_gathered(self):
+        state = {'active': 0, 'max_active': 0}
+
+        async def slow_validator(value):
+            state['active'] += 1
+            state['max_active'] = max(state['max_active'], state['active'])
+            await asyncio.sleep(0.01 if value == 'slow' else 0)
+            state['active'] -= 1
+            raise ValidationError('Invalid value')
+
+        class AsyncConcurrentSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            CONCURRENT_VALIDATION = True
+            FIELD_VALIDATION_ERRORS = {'slow_validator': 5301}
+
+            first = serializers.CharField(validators=[slow_validator])
+            second = serializers.CharField(validators=[slow_validator])
+            third = serializers.IntegerField()
+
+        serializer = AsyncConcurrentSerializer(data={'first': 'slow', 'second': 'fast', 'third': 'a'})
+        self.assertFalse(async_to_sync(serializer.ais_valid)())
+
+        self.assertEqual(state['max_active'], 2)
+        self.assertEqual([(error['field'], error['code']) for error in serializer.errors['errors']],
+                         [('first', 5301), ('second', 5301), ('third', 2013)])
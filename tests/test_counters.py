@@ -0,0 +1,97 @@
+import threading
+
+from django.test import override_settings
+from rest_framework.exceptions import NotAuthenticated, ValidationError
+from rest_framework.reverse import reverse
+
+from rest_framework_friendly_errors.counters import ErrorCounters, error_counters, render_prometheus
+from rest_framework_friendly_errors.handlers import friendly_exception_handler
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+class ErrorCountersTestCase(BaseTestCase):
+
+    def setUp(self):
+        super(ErrorCountersTestCase, self).setUp()
+        error_counters.reset()
+
+    def test_threads(self):
+        counters = ErrorCounters()
+
+        def work():
+            for _ in range(1000):
+                counters.increment(2002, 'title')
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counters.increment(2002, 'title')
+
+        self.assertEqual(counters.collect(), {(2002, 'title', 'ValidationError'): 4001})
+
+    def test_count_nested_entries(self):
+        counters = ErrorCounters()
+        counters.count_entries({'code': 1000, 'message': 'Validation Failed', 'errors': [
+            {'code': 2002, 'field': 'title', 'message': '', 'errors': []},
+            {'code': 1000, 'field': 'author', 'message': '', 'errors': [
+                {'code': 2002, 'field': 'name', 'message': '', 'errors': []},
+            ]},
+        ]})
+        counters.count_entries({'code': 8000, 'message': 'Custom', 'errors': []})
+
+        self.assertEqual(counters.collect(), {
+            (2002, 'title', 'ValidationError'): 1,
+            (2002, 'name', 'ValidationError'): 1,
+            (8000, None, 'ValidationError'): 1,
+        })
+
+    def test_disabled_by_default(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        serializer = SnippetSerializer(data=self.data_set)
+        serializer.is_valid()
+        serializer.errors
+        friendly_exception_handler(NotAuthenticated(), {})
+        self.assertEqual(error_counters.collect(), {})
+
+    @override_settings(FRIENDLY_ERRORS={'COUNT_ERRORS': True})
+    def test_serializer_and_handler(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        serializer = SnippetSerializer(data=self.data_set)
+        with self.assertRaises(ValidationError) as context:
+            serializer.is_valid(raise_exception=True)
+        # errors are counted once per build, not on every read
+        serializer.errors
+        friendly_exception_handler(context.exception, {})
+        friendly_exception_handler(NotAuthenticated(), {})
+
+        self.assertEqual(error_counters.collect(), {
+            (2011, 'linenos', 'ValidationError'): 1,
+            (4003, None, 'NotAuthenticated'): 1,
+        })
+
+    def test_render_prometheus(self):
+        counters = ErrorCounters()
+        counters.increment(2002, 'title')
+        counters.increment(2002, 'title')
+        counters.increment(4003, None, 'NotAuthenticated')
+        counters.increment(100, 'say "hi"\\')
+
+        self.assertEqual(render_prometheus(counters).splitlines(), [
+            '# HELP friendly_errors_total Number of error codes returned by drf-friendly-errors.',
+            '# TYPE friendly_errors_total counter',
+            'friendly_errors_total{code="100",field="say \\"hi\\"\\\\",exception="ValidationError"} 1',
+            'friendly_errors_total{code="2002",field="title",exception="ValidationError"} 2',
+            'friendly_errors_total{code="4003",field="",exception="NotAuthenticated"} 1',
+        ])
+
+    def test_view(self):
+        error_counters.increment(2002, 'title')
+        response = self.client.get(reverse('error-counters'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('friendly_errors_total{code="2002",field="title",exception="ValidationError"} 1',
+                      response.content.decode())
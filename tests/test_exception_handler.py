@@ -1,10 +1,26 @@
+from unittest import TestCase, mock
+
+from django.test import override_settings
+from rest_framework import serializers
+from rest_framework.exceptions import APIException, ErrorDetail, ValidationError
 from rest_framework.reverse import reverse
 from rest_framework.test import APIRequestFactory
 
-from rest_framework_friendly_errors import settings
+from rest_framework_friendly_errors import handlers, settings
+from rest_framework_friendly_errors.exceptions import FriendlyValidationError
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
 
 from tests import BaseTestCase
-from tests.views import SnippetList
+from tests.exceptions import unknown_error
+from tests.serializers import SnippetSerializer
+from tests.views import SnippetList, SnippetValidateView
+
+
+class RawErrorSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    title = serializers.CharField()
+
+    def validate(self, attrs):
+        raise ValidationError({'code': 228, 'message': 'First letter must be an uppercase'})
 
 
 class ExceptionHandlerTestCase(BaseTestCase):
@@ -50,3 +66,84 @@ class ExceptionHandlerTestCase(BaseTestCase):
             response.data['code'],
             settings.FRIENDLY_EXCEPTION_DICT.get('NotAuthenticated')
         )
+
+    def test_friendly_errors_are_not_transformed(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        request = self.factory.post(reverse('snippet-validate'), data=self.data_set)
+        with mock.patch.object(handlers, 'transform_response_data_values') as transform:
+            response = SnippetValidateView.as_view()(request)
+        self.assertFalse(transform.called)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['code'], settings.VALIDATION_FAILED_CODE)
+        self.assertEqual(response.data['errors'][0]['code'],
+                         settings.FRIENDLY_FIELD_ERRORS['BooleanField']['invalid'])
+        self.assertEqual(response.data['errors'][0]['field'], 'linenos')
+
+    def test_raw_serializer_errors_are_transformed(self):
+        serializer = RawErrorSerializer(data={'title': 'title'})
+        with self.assertRaises(ValidationError) as context:
+            serializer.is_valid(raise_exception=True)
+        self.assertNotIsInstance(context.exception, FriendlyValidationError)
+
+        response = handlers.friendly_exception_handler(context.exception, {})
+        self.assertEqual(response.data['code'], 228)
+        self.assertEqual(response.data['message'], 'First letter must be an uppercase')
+
+    def test_catch_all_exceptions(self):
+        request = self.factory.get(reverse('unknown-error'))
+        with override_settings(FRIENDLY_ERRORS={'CATCH_ALL_EXCEPTIONS': True}), \
+                mock.patch.object(handlers, 'exception_handler', wraps=handlers.exception_handler) as handler:
+            response = unknown_error(request)
+        self.assertEqual(handler.call_count, 1)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data['message'], 'Unknown error')
+        self.assertEqual(response.data['code'],
+                         settings.FRIENDLY_EXCEPTION_DICT.get('APIException'))
+
+    def test_catch_all_exceptions_without_detail(self):
+        request = self.factory.get(reverse('unknown-error'))
+        with override_settings(FRIENDLY_ERRORS={'CATCH_ALL_EXCEPTIONS': True,
+                                                'CATCH_ALL_EXCEPTIONS_DETAIL': False}):
+            response = unknown_error(request)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data['message'], APIException.default_detail)
+
+
+class FriendlyValidationErrorTestCase(BaseTestCase):
+
+    def setUp(self):
+        super(FriendlyValidationErrorTestCase, self).setUp()
+        self.data_set['linenos'] = 'A text instead of a bool'
+        serializer = SnippetSerializer(data=self.data_set)
+        with self.assertRaises(FriendlyValidationError) as context:
+            serializer.is_valid(raise_exception=True)
+        self.exc = context.exception
+
+    def test_get_codes(self):
+        codes = self.exc.get_codes()
+        self.assertEqual(codes['code'], settings.VALIDATION_FAILED_CODE)
+        self.assertEqual(codes['errors'][0]['code'], settings.FRIENDLY_FIELD_ERRORS['BooleanField']['invalid'])
+
+    def test_get_full_details(self):
+        details = self.exc.get_full_details()
+        self.assertEqual(details['code'], settings.VALIDATION_FAILED_CODE)
+        self.assertEqual(details['errors'][0]['field'], 'linenos')
+
+
+class TransformValuesTestCase(TestCase):
+
+    def test_values_are_transformed_in_place(self):
+        errors = [{'code': ErrorDetail('2002'), 'field': ErrorDetail('None'), 'message': 'Text'}]
+        data = {'code': '1000', 'message': 'Validation Failed', 'errors': errors}
+        handlers.transform_values(data)
+        self.assertEqual(data, {
+            'code': 1000,
+            'message': 'Validation Failed',
+            'errors': [{'code': 2002, 'field': None, 'message': 'Text'}],
+        })
+        self.assertIs(data['errors'], errors)
+
+    def test_transformed_values_are_kept(self):
+        data = {'code': 1000, 'field': None, 'errors': [1, None, 'a']}
+        handlers.transform_values(data)
+        self.assertEqual(data, {'code': 1000, 'field': None, 'errors': [1, None, 'a']})
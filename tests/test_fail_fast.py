@@ -0,0 +1,94 @@
+from asgiref.sync import async_to_sync
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from rest_framework_friendly_errors.executor import shutdown_executor
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+
+from tests import BaseTestCase
+
+
+class RecordingValidator:
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __call__(self, value):
+        self.calls.append(value)
+
+
+def make_serializer(max_field_errors, calls, concurrent=False):
+    class FailFastSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+        MAX_FIELD_ERRORS = max_field_errors
+        CONCURRENT_VALIDATION = concurrent
+
+        first = serializers.IntegerField()
+        second = serializers.IntegerField()
+        third = serializers.CharField(validators=[RecordingValidator(calls)])
+
+        def validate_third(self, value):
+            calls.append('validate_third')
+            return value
+
+    return FailFastSerializer
+
+
+INVALID_DATA = {'first': 'a', 'second': 'b', 'third': 'c'}
+
+
+class MaxFieldErrorsTestCase(BaseTestCase):
+
+    def tearDown(self):
+        shutdown_executor()
+
+    def test_all_fields_are_validated_by_default(self):
+        calls = []
+        serializer = make_serializer(None, calls)(data=INVALID_DATA)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']], ['first', 'second'])
+        self.assertEqual(calls, ['c', 'validate_third'])
+
+    def test_validation_stops_after_max_field_errors(self):
+        calls = []
+        serializer = make_serializer(1, calls)(data=INVALID_DATA)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']], ['first'])
+        self.assertEqual(calls, [])
+
+    def test_remaining_fields_are_skipped(self):
+        calls = []
+        serializer = make_serializer(2, calls)(data=INVALID_DATA)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']], ['first', 'second'])
+        self.assertEqual(calls, [])
+
+    def test_valid_data_is_not_affected(self):
+        calls = []
+        serializer = make_serializer(1, calls)(data={'first': 1, 'second': 2, 'third': 'c'})
+
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {'first': 1, 'second': 2, 'third': 'c'})
+
+    def test_concurrent_validation_keeps_first_errors(self):
+        calls = []
+        serializer = make_serializer(1, calls, concurrent=True)(data=INVALID_DATA)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']], ['first'])
+
+    def test_async_validation_stops_after_max_field_errors(self):
+        calls = []
+        serializer = make_serializer(1, calls)(data=INVALID_DATA)
+
+        self.assertFalse(async_to_sync(serializer.ais_valid)())
+        self.assertEqual([error['field'] for error in serializer.errors['errors']], ['first'])
+        self.assertEqual(calls, [])
+
+    def test_raise_exception(self):
+        serializer = make_serializer(1, [])(data=INVALID_DATA)
+
+        with self.assertRaises(ValidationError):
+            serializer.is_valid(raise_exception=True)
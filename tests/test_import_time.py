@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from tests.benchmarks import measure_import_time
+
+# Generous budget for the package's own modules (microseconds), real cost is a few milliseconds
+IMPORT_TIME_BUDGET = 50000
+
+
+class ImportTimeTestCase(TestCase):
+
+    def test_mixins_import_only_package_modules(self):
+        import_times = measure_import_time('rest_framework_friendly_errors.mixins')
+
+        self.assertIn('rest_framework_friendly_errors.mixins', import_times)
+        self.assertEqual(
+            [name for name in import_times if name.split('.')[0] not in ('rest_framework_friendly_errors', '__future__')],
+            []
+        )
+
+    def test_settings_import_does_not_import_mixins(self):
+        import_times = measure_import_time('rest_framework_friendly_errors.settings')
+
+        self.assertIn('rest_framework_friendly_errors.settings', import_times)
+        self.assertNotIn('rest_framework_friendly_errors.mixins', import_times)
+        self.assertNotIn('rest_framework_friendly_errors.resolvers', import_times)
+
+    def test_import_time_budget(self):
+        import_times = measure_import_time('rest_framework_friendly_errors.serializers')
+        self.assertLess(sum(import_times.values()), IMPORT_TIME_BUDGET)
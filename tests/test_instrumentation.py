@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.exceptions import NotAuthenticated
+
+from rest_framework_friendly_errors.handlers import friendly_exception_handler
+from rest_framework_friendly_errors.instrumentation import errors_formatted
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+class InstrumentationTestCase(BaseTestCase):
+
+    def setUp(self):
+        super(InstrumentationTestCase, self).setUp()
+        self.metrics = []
+
+    def get_invalid_serializer(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        self.data_set['rating'] = 'text instead of float'
+        serializer = SnippetSerializer(data=self.data_set)
+        self.assertFalse(serializer.is_valid())
+        return serializer
+
+    def test_disabled_by_default(self):
+        callback = mock.Mock()
+        with override_settings(FRIENDLY_ERRORS={'INSTRUMENTATION_CALLBACK': callback}):
+            self.get_invalid_serializer().errors
+            friendly_exception_handler(NotAuthenticated(), {})
+        callback.assert_not_called()
+
+    def test_build_pretty_errors_metrics(self):
+        with override_settings(FRIENDLY_ERRORS={'INSTRUMENTATION': True,
+                                                'INSTRUMENTATION_CALLBACK': self.metrics.append}):
+            self.get_invalid_serializer().errors
+
+        self.assertEqual(len(self.metrics), 1)
+        metrics = self.metrics[0]
+        self.assertEqual(metrics['stage'], 'build_pretty_errors')
+        self.assertEqual(metrics['sender'], 'SnippetSerializer')
+        self.assertEqual(metrics['errors'], 2)
+        self.assertEqual(metrics['depth'], 0)
+        self.assertEqual(metrics['validators_rerun'], 0)
+        self.assertGreaterEqual(metrics['duration'], 0)
+
+    def test_exception_handler_metrics(self):
+        with override_settings(FRIENDLY_ERRORS={'INSTRUMENTATION': True,
+                                                'INSTRUMENTATION_CALLBACK': self.metrics.append}):
+            friendly_exception_handler(NotAuthenticated(), {})
+
+        self.assertEqual(len(self.metrics), 1)
+        metrics = self.metrics[0]
+        self.assertEqual(metrics['stage'], 'exception_handler')
+        self.assertEqual(metrics['sender'], 'NotAuthenticated')
+        self.assertEqual(metrics['errors'], 0)
+        self.assertEqual(metrics['status_code'], 401)
+
+    def test_signal(self):
+        def receiver(sender, metrics, **kwargs):
+            self.metrics.append((sender, metrics))
+
+        errors_formatted.connect(receiver)
+        try:
+            with override_settings(FRIENDLY_ERRORS={'INSTRUMENTATION': True}):
+                self.get_invalid_serializer().errors
+        finally:
+            errors_formatted.disconnect(receiver)
+
+        self.assertEqual(len(self.metrics), 1)
+        self.assertIs(self.metrics[0][0], SnippetSerializer)
+
+    def test_callback_import_string(self):
+        callback = 'rest_framework_friendly_errors.instrumentation.log_metrics'
+        with override_settings(FRIENDLY_ERRORS={'INSTRUMENTATION': True, 'INSTRUMENTATION_CALLBACK': callback}):
+            with self.assertLogs('rest_framework_friendly_errors', 'INFO') as logs:
+                self.get_invalid_serializer().errors
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].friendly_errors['stage'], 'build_pretty_errors')
+        self.assertIn('SnippetSerializer build_pretty_errors', logs.output[0])
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from django.test import override_settings
+from django.utils import translation
+from django.utils.translation import gettext_lazy
+
+from rest_framework_friendly_errors.messages import _resolve_message, clear_message_cache, resolve_message
+
+from tests.serializers import SnippetSerializer
+
+REQUIRED = gettext_lazy('This field is required.')
+
+
+class ResolveMessageTestCase(TestCase):
+
+    def setUp(self):
+        clear_message_cache()
+
+    def test_plain_strings_are_returned_as_is(self):
+        message = 'Validation Failed'
+        self.assertIs(resolve_message(message), message)
+        self.assertEqual(resolve_message('Max {max_length}', max_length=10), 'Max 10')
+
+    def test_lazy_message_is_resolved_once_per_language(self):
+        with translation.override('en'):
+            self.assertEqual(resolve_message(REQUIRED), 'This field is required.')
+            self.assertEqual(resolve_message(REQUIRED), 'This field is required.')
+        with translation.override('pl'):
+            self.assertEqual(resolve_message(REQUIRED), str(REQUIRED))
+            self.assertNotEqual(resolve_message(REQUIRED), 'This field is required.')
+
+        cache_info = _resolve_message.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (2, 2))
+
+    def test_format_params_are_part_of_the_key(self):
+        message = gettext_lazy('Ensure this field has no more than {max_length} characters.')
+        with translation.override('en'):
+            self.assertEqual(resolve_message(message, max_length=10),
+                             'Ensure this field has no more than 10 characters.')
+            self.assertEqual(resolve_message(message, max_length=20),
+                             'Ensure this field has no more than 20 characters.')
+        self.assertEqual(_resolve_message.cache_info().misses, 2)
+
+    def test_cache_is_cleared_on_setting_changed(self):
+        resolve_message(REQUIRED)
+        with override_settings(LANGUAGE_CODE='en'):
+            self.assertEqual(_resolve_message.cache_info().currsize, 0)
+
+    def test_serializer_errors_have_no_lazy_messages(self):
+        serializer = SnippetSerializer(data={})
+        self.assertFalse(serializer.is_valid())
+
+        self.assertIs(type(serializer.errors['message']), str)
+        self.assertEqual(_resolve_message.cache_info().misses, 1)
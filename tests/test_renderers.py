@@ -0,0 +1,82 @@
+import json
+from unittest import mock, skipIf
+
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from rest_framework_friendly_errors import renderers
+from rest_framework_friendly_errors.renderers import FriendlyJSONRenderer
+from rest_framework_friendly_errors.serializers import FEListSerializer
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+class BulkSnippetSerializer(SnippetSerializer):
+    class Meta:
+        list_serializer_class = FEListSerializer
+
+
+class FriendlyJSONRendererTestCase(BaseTestCase):
+
+    def setUp(self):
+        super(FriendlyJSONRendererTestCase, self).setUp()
+        self.renderer = FriendlyJSONRenderer()
+
+    def assert_same_as_json_renderer(self, data, accepted_media_type=None):
+        rendered = self.renderer.render(data, accepted_media_type)
+        self.assertEqual(json.loads(rendered.decode()),
+                         json.loads(JSONRenderer().render(data, accepted_media_type).decode()))
+        return rendered
+
+    def test_field_errors(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        self.data_set['rating'] = 'text instead of float'
+        serializer = SnippetSerializer(data=self.data_set)
+        serializer.is_valid()
+        self.assert_same_as_json_renderer(serializer.errors)
+
+    def test_bulk_errors(self):
+        items = [dict(self.data_set, linenos='A text instead of a bool') for _ in range(20)]
+        serializer = BulkSnippetSerializer(data=items, many=True)
+        serializer.is_valid()
+        self.assert_same_as_json_renderer(serializer.errors)
+
+    def test_lazy_messages_and_custom_entries(self):
+        self.assert_same_as_json_renderer({
+            'code': 1000,
+            'message': gettext_lazy('Validation Failed'),
+            'errors': [
+                {'code': 1000, 'field': 'author', 'message': gettext_lazy('Validation Failed'), 'errors': [
+                    {'code': 2002, 'field': 'name', 'message': gettext_lazy('This field is required.'), 'errors': []},
+                ]},
+                {'code': 228, 'field': 'title', 'message': gettext_lazy('Custom'), 'errors': []},
+            ],
+            'truncated': True,
+            'total': 5,
+        })
+
+    def test_other_data(self):
+        self.assertEqual(self.renderer.render({'detail': 'Not found.'}), JSONRenderer().render({'detail': 'Not found.'}))
+        self.assertEqual(self.renderer.render([1, 2]), b'[1,2]')
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_indent(self):
+        data = {'code': 9001, 'message': 'Error', 'errors': []}
+        rendered = self.assert_same_as_json_renderer(data, 'application/json; indent=4')
+        self.assertIn(b'\n    "code": 9001', rendered)
+
+    def test_line_separators_are_escaped(self):
+        rendered = self.renderer.render({'code': 1, 'message': 'a\u2028b', 'errors': []})
+        self.assertIn(b'a\\u2028b', rendered)
+
+    @skipIf(renderers.orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            self.assert_same_as_json_renderer({'code': 9001, 'message': 'Error', 'errors': []})
+        dumps.assert_called_once()
+
+    def test_without_orjson(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            rendered = self.assert_same_as_json_renderer({'code': 9001, 'message': 'Error', 'errors': []})
+        self.assertEqual(rendered, b'{"code":9001,"message":"Error","errors":[]}')
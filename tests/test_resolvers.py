@@ -0,0 +1,90 @@
+import gc
+from unittest import TestCase
+
+from rest_framework import serializers
+
+from rest_framework_friendly_errors import settings
+from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+from rest_framework_friendly_errors.resolvers import (_field_error_codes, _fields_metadata,
+                                                      get_field_error_codes, get_field_metadata,
+                                                      get_fields_metadata, get_validator_error_codes)
+
+
+class FieldErrorCodesTestCase(TestCase):
+
+    def test_field_class_codes(self):
+        codes = get_field_error_codes(serializers.CharField)
+        self.assertEqual(codes, settings.FRIENDLY_FIELD_ERRORS['CharField'])
+
+    def test_parent_class_codes(self):
+        class CustomRelatedField(serializers.PrimaryKeyRelatedField):
+            pass
+
+        codes = get_field_error_codes(CustomRelatedField)
+        self.assertEqual(codes, settings.FRIENDLY_FIELD_ERRORS['PrimaryKeyRelatedField'])
+
+    def test_codes_are_cached(self):
+        codes = get_field_error_codes(serializers.IntegerField)
+        self.assertIs(get_field_error_codes(serializers.IntegerField), codes)
+
+    def test_dynamic_field_class_is_not_leaked(self):
+        field_class = type('DynamicField', (serializers.CharField,), {})
+        get_field_error_codes(field_class)
+        self.assertIn(field_class, _field_error_codes)
+
+        del field_class
+        gc.collect()
+        self.assertFalse(any(klass.__name__ == 'DynamicField' for klass in _field_error_codes.keys()))
+
+
+class ChildSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    value = serializers.IntegerField()
+
+
+class ParentSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    FIELD_VALIDATION_ERRORS = {'validate_title': 5000}
+
+    title = serializers.CharField()
+    child = ChildSerializer()
+    tags = serializers.PrimaryKeyRelatedField(many=True, queryset=[])
+
+
+class FieldMetadataTestCase(TestCase):
+
+    def test_metadata_is_shared_by_instances(self):
+        metadata = get_fields_metadata(ParentSerializer, ParentSerializer().fields)
+        self.assertIs(get_fields_metadata(ParentSerializer, ParentSerializer().fields), metadata)
+        self.assertEqual(list(metadata), ['title', 'child', 'tags'])
+
+    def test_field_metadata(self):
+        fields = ParentSerializer().fields
+        title = get_field_metadata(ParentSerializer, fields, 'title')
+        child = get_field_metadata(ParentSerializer, fields, 'child')
+
+        self.assertIs(title.field_class, serializers.CharField)
+        self.assertEqual(title.error_codes, settings.FRIENDLY_FIELD_ERRORS['CharField'])
+        self.assertFalse(title.nested)
+        self.assertIsNone(title.child_relation_class)
+        self.assertTrue(child.nested)
+
+    def test_child_relation_codes(self):
+        tags = get_field_metadata(ParentSerializer, ParentSerializer().fields, 'tags')
+
+        self.assertIs(tags.child_relation_class, serializers.PrimaryKeyRelatedField)
+        self.assertEqual(tags.error_codes['does_not_exist'],
+                         settings.FRIENDLY_FIELD_ERRORS['PrimaryKeyRelatedField']['does_not_exist'])
+        self.assertEqual(tags.error_codes['required'], settings.FRIENDLY_FIELD_ERRORS['ManyRelatedField']['required'])
+
+    def test_field_of_other_class_is_not_cached(self):
+        fields = ParentSerializer().fields
+        get_fields_metadata(ParentSerializer, fields)
+        fields['title'] = serializers.IntegerField()
+
+        metadata = get_field_metadata(ParentSerializer, fields, 'title')
+        self.assertIs(metadata.field_class, serializers.IntegerField)
+        self.assertIs(_fields_metadata[ParentSerializer]['title'].field_class, serializers.CharField)
+
+    def test_validator_error_codes(self):
+        codes = get_validator_error_codes(ParentSerializer)
+        self.assertEqual(codes['validate_title'], 5000)
+        self.assertEqual(codes['MaxValueValidator'], settings.FRIENDLY_VALIDATOR_ERRORS['MaxValueValidator'])
@@ -1,6 +1,14 @@
+import json
+from unittest import mock
+
+from django.core.validators import MaxLengthValidator
+from django.test import override_settings
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.schemas.openapi import AutoSchema
 from rest_framework_friendly_errors import settings
 from rest_framework_friendly_errors.mixins import FriendlyErrorMessagesMixin
+from rest_framework_friendly_errors.serializers import FEListSerializer
 
 from tests import BaseTestCase
 from tests.serializers import SnippetSerializer, AnotherSnippetSerializer
@@ -48,6 +56,15 @@ class SerializerErrorsTestCase(BaseTestCase):
         self.assertTrue(s.errors)
         self.assertTrue(type(s.errors), dict)
 
+    def test_errors_are_plain(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        s = run_is_valid(SnippetSerializer, data=self.data_set)
+
+        self.assertIs(type(s.errors['errors'][0]), dict)
+        self.assertEqual(json.loads(json.dumps(s.errors))['errors'][0]['field'], 'linenos')
+        detail = ValidationError(s.errors).detail
+        self.assertEqual(detail['errors'][0]['code'], str(s.errors['errors'][0]['code']))
+
     def test_error_message_content(self):
         self.data_set['linenos'] = 'A text instead of a bool'
         s = run_is_valid(SnippetSerializer, data=self.data_set)
@@ -165,3 +182,263 @@ class SerializerErrorsTestCase(BaseTestCase):
         self.assertEqual(s.errors['errors'][0]['field'], 'language')
         code = settings.FRIENDLY_FIELD_ERRORS['ChoiceField']['invalid_choice']
         self.assertEqual(s.errors['errors'][0]['code'], code)
+
+
+class CountingValidator:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        raise serializers.ValidationError('Counted error')
+
+
+class ErrorSourceTestCase(BaseTestCase):
+
+    def test_validator_is_not_run_again(self):
+        validator = CountingValidator()
+
+        class CountingSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = serializers.CharField(validators=[validator])
+
+            FIELD_VALIDATION_ERRORS = {'CountingValidator': 5100}
+
+        s = run_is_valid(CountingSerializer, data={'text_field': 'text'})
+        self.assertEqual(s.errors['errors'][0]['code'], 5100)
+        self.assertEqual(s.errors['errors'][0]['field'], 'text_field')
+        self.assertEqual(validator.calls, 1)
+
+    def test_validator_source_is_recorded(self):
+        self.data_set['title'] = 'A title'
+        s = run_is_valid(SnippetSerializer, data=self.data_set)
+        error = s._errors['title'][0]
+        self.assertEqual(s.get_error_source('title', error), 'is_proper_title')
+
+    def test_field_validators_are_not_replaced(self):
+        fields = SnippetSerializer().fields
+        self.assertIn(MaxLengthValidator, [type(validator) for validator in fields['title'].validators])
+        schema = {}
+        AutoSchema().map_field_validators(fields['title'], schema)
+        self.assertEqual(schema['maxLength'], 10)
+
+    def test_field_with_own_run_validators(self):
+        class StrictCharField(serializers.CharField):
+            def run_validators(self, value):
+                if value == 'bad':
+                    raise serializers.ValidationError('Custom run_validators')
+                super(StrictCharField, self).run_validators(value)
+
+        class StrictSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = StrictCharField(validators=[CountingValidator()])
+
+            FIELD_VALIDATION_ERRORS = {'CountingValidator': 5100}
+
+        s = run_is_valid(StrictSerializer, data={'text_field': 'bad'})
+        self.assertEqual(s.errors['errors'][0]['message'], 'Custom run_validators')
+        self.assertIsNone(s.errors['errors'][0]['code'])
+
+        s = run_is_valid(StrictSerializer, data={'text_field': 'text'})
+        self.assertEqual(s.errors['errors'][0]['code'], 5100)
+
+    def test_validate_method_is_not_called_again(self):
+        class CountingSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = serializers.CharField()
+            calls = 0
+
+            def validate_text_field(self, value):
+                self.calls += 1
+                raise serializers.ValidationError('Counted error')
+
+            FIELD_VALIDATION_ERRORS = {'validate_text_field': 5101}
+
+        s = run_is_valid(CountingSerializer, data={'text_field': 'text'})
+        self.assertEqual(s.errors['errors'][0]['code'], 5101)
+        self.assertEqual(s.calls, 1)
+
+    def test_unknown_error_without_validate_method(self):
+        class NoMethodSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = serializers.CharField()
+
+        s = run_is_valid(NoMethodSerializer, data={'text_field': 'x' * 10})
+        s._errors = {'text_field': [serializers.ErrorDetail('Oops', code='unknown')]}
+        self.assertIsNone(s.errors['errors'][0]['code'])
+        self.assertEqual(s.errors['errors'][0]['field'], 'text_field')
+
+
+class ErrorsCacheTestCase(BaseTestCase):
+
+    def test_errors_are_built_once(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        s = run_is_valid(SnippetSerializer, data=self.data_set)
+        with mock.patch.object(s, 'build_pretty_errors', wraps=s.build_pretty_errors) as build:
+            first = s.errors
+            second = s.errors
+        self.assertIs(first, second)
+        self.assertEqual(build.call_count, 1)
+
+    def test_errors_are_rebuilt_when_changed(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        s = run_is_valid(SnippetSerializer, data=self.data_set)
+        self.assertEqual(s.errors['errors'][0]['field'], 'linenos')
+
+        s._errors = {}
+        self.assertFalse(s.errors)
+
+
+class ListSerializerErrorsTestCase(BaseTestCase):
+
+    def test_valid_list(self):
+        s = FEListSerializer(child=SnippetSerializer(), data=[self.data_set, self.data_set])
+        self.assertTrue(s.is_valid())
+        self.assertFalse(s.errors)
+
+    def test_item_errors_have_index(self):
+        invalid = dict(self.data_set, linenos='A text instead of a bool')
+        s = FEListSerializer(child=SnippetSerializer(), data=[self.data_set, invalid, self.data_set, invalid])
+        self.assertFalse(s.is_valid())
+        self.assertEqual(s.errors['code'], settings.VALIDATION_FAILED_CODE)
+        self.assertEqual([entry['field'] for entry in s.errors['errors']], [1, 3])
+
+        item_errors = s.errors['errors'][0]['errors']
+        code = settings.FRIENDLY_FIELD_ERRORS['BooleanField']['invalid']
+        self.assertEqual(item_errors[0]['code'], code)
+        self.assertEqual(item_errors[0]['field'], 'linenos')
+
+    def test_child_fields_are_built_once(self):
+        invalid = dict(self.data_set, linenos='A text instead of a bool')
+        child = SnippetSerializer()
+        s = FEListSerializer(child=child, data=[invalid] * 10)
+        s.is_valid()
+        with mock.patch.object(type(child), 'get_fields', wraps=child.get_fields) as get_fields:
+            self.assertEqual(len(s.errors['errors']), 10)
+        self.assertEqual(get_fields.call_count, 0)
+
+    def test_not_a_list(self):
+        s = FEListSerializer(child=SnippetSerializer(), data=self.data_set)
+        self.assertFalse(s.is_valid())
+        self.assertEqual(s.errors['errors'], [])
+        self.assertTrue(s.errors['message'])
+
+
+class BulkSnippetSerializer(SnippetSerializer):
+    class Meta:
+        list_serializer_class = FEListSerializer
+
+
+class SnippetsSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    name = serializers.CharField()
+    snippets = BulkSnippetSerializer(many=True)
+
+
+class NestedListSerializerErrorsTestCase(BaseTestCase):
+
+    def test_item_errors(self):
+        invalid = dict(self.data_set, linenos='A text instead of a bool')
+        s = run_is_valid(SnippetsSerializer, data={'name': 'name', 'snippets': [self.data_set, invalid]})
+
+        entry = s.errors['errors'][0]
+        self.assertEqual(entry['field'], 'snippets')
+        self.assertEqual(entry['code'], settings.VALIDATION_FAILED_CODE)
+        self.assertEqual([item['field'] for item in entry['errors']], [1])
+        self.assertEqual(entry['errors'][0]['errors'][0]['field'], 'linenos')
+        self.assertEqual(entry['errors'][0]['errors'][0]['code'],
+                         settings.FRIENDLY_FIELD_ERRORS['BooleanField']['invalid'])
+
+    def test_not_a_list(self):
+        s = run_is_valid(SnippetsSerializer, data={'name': 'name', 'snippets': self.data_set})
+
+        entry = s.errors['errors'][0]
+        self.assertEqual(entry['field'], 'snippets')
+        self.assertIsInstance(entry['message'], str)
+        self.assertEqual(entry['errors'], [])
+
+
+class NestedSnippetSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+    name = serializers.CharField(max_length=5)
+    snippet = SnippetSerializer()
+
+
+class ErrorLimitTestCase(BaseTestCase):
+
+    def test_errors_are_not_truncated_by_default(self):
+        s = run_is_valid(SimpleSerializerClass, data={})
+        self.assertEqual(len(s.errors['errors']), 2)
+        self.assertNotIn('truncated', s.errors)
+
+    def test_max_errors(self):
+        with override_settings(FRIENDLY_ERRORS={'MAX_ERRORS': 1}):
+            s = run_is_valid(SimpleSerializerClass, data={})
+            self.assertEqual(len(s.errors['errors']), 1)
+            self.assertTrue(s.errors['truncated'])
+            self.assertEqual(s.errors['total'], 2)
+
+    def test_max_errors_in_list(self):
+        invalid = dict(self.data_set, linenos='A text instead of a bool')
+        with override_settings(FRIENDLY_ERRORS={'MAX_ERRORS': 3}):
+            s = FEListSerializer(child=SnippetSerializer(), data=[invalid] * 10)
+            s.is_valid()
+            self.assertEqual(len(s.errors['errors']), 3)
+            self.assertTrue(s.errors['truncated'])
+            self.assertEqual(s.errors['total'], 10)
+
+    def test_max_nested_depth(self):
+        data = {'name': 'Too long name', 'snippet': dict(self.data_set, linenos='A text instead of a bool')}
+        with override_settings(FRIENDLY_ERRORS={'MAX_NESTED_DEPTH': 0}):
+            s = run_is_valid(NestedSnippetSerializer, data=data)
+            self.assertEqual([entry['field'] for entry in s.errors['errors']], ['name', 'snippet'])
+            self.assertEqual(s.errors['errors'][1]['errors'], [])
+            self.assertTrue(s.errors['truncated'])
+            self.assertEqual(s.errors['total'], 2)
+
+        with override_settings(FRIENDLY_ERRORS={'MAX_NESTED_DEPTH': 1}):
+            s = run_is_valid(NestedSnippetSerializer, data=data)
+            self.assertEqual(s.errors['errors'][1]['errors'][0]['field'], 'linenos')
+            self.assertNotIn('truncated', s.errors)
+
+
+class NonFieldErrorsTestCase(BaseTestCase):
+
+    def test_message_keyed_error(self):
+        self.data_set['title'] = 'A Python'
+        self.data_set['language'] = 'c++'
+        s = run_is_valid(SnippetSerializer, data=self.data_set)
+        self.assertEqual(s.errors['code'], 8000)
+        self.assertEqual(s.errors['message'], 'Must be a python language')
+
+    def test_code_keyed_error(self):
+        class CodeSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = serializers.CharField()
+
+            def validate(self, attrs):
+                raise serializers.ValidationError('Custom error', code='custom')
+
+            NON_FIELD_ERRORS = {'custom': 8100}
+
+        s = run_is_valid(CodeSerializer, data={'text_field': 'text'})
+        self.assertEqual(s.errors['code'], 8100)
+
+    def test_invalid_data(self):
+        s = run_is_valid(SnippetSerializer, data='not a dict')
+        self.assertEqual(s.errors['code'], settings.FRIENDLY_NON_FIELD_ERRORS['invalid'])
+
+    def test_aggregated_non_field_errors(self):
+        class ManyErrorsSerializer(FriendlyErrorMessagesMixin, serializers.Serializer):
+            text_field = serializers.CharField()
+
+            def validate(self, attrs):
+                raise serializers.ValidationError({
+                    'non_field_errors': ['First error', 'Second error'],
+                    'text_field': ['Field error'],
+                })
+
+            NON_FIELD_ERRORS = {'First error': 8101, 'Second error': 8102}
+
+        with override_settings(FRIENDLY_ERRORS={'AGGREGATE_NON_FIELD_ERRORS': True}):
+            s = run_is_valid(ManyErrorsSerializer, data={'text_field': 'text'})
+            self.assertEqual(s.errors['code'], settings.VALIDATION_FAILED_CODE)
+            self.assertEqual([(entry['field'], entry['message']) for entry in s.errors['errors']], [
+                (None, 'First error'),
+                (None, 'Second error'),
+                ('text_field', 'Field error'),
+            ])
+            self.assertEqual([entry['code'] for entry in s.errors['errors'][:2]], [8101, 8102])
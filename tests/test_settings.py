@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from django.test import override_settings
+from rest_framework import serializers
+
+from rest_framework_friendly_errors import settings
+from rest_framework_friendly_errors.resolvers import get_field_error_codes
+from rest_framework_friendly_errors.settings import (DEFAULT_FIELD_ERRORS,
+                                                     FriendlyErrorsSettings,
+                                                     friendly_settings)
+
+
+class FriendlyErrorsSettingsTestCase(TestCase):
+
+    def test_defaults(self):
+        friendly = FriendlyErrorsSettings({})
+        self.assertEqual(friendly.VALIDATION_FAILED_CODE, 1000)
+        self.assertEqual(friendly.FRIENDLY_FIELD_ERRORS['CharField'], DEFAULT_FIELD_ERRORS['CharField'])
+
+    def test_user_settings(self):
+        friendly = FriendlyErrorsSettings({
+            'VALIDATION_FAILED_CODE': 1,
+            'FIELD_ERRORS': {'CharField': {'required': 10}, 'CustomField': {'null': 12}},
+            'VALIDATOR_ERRORS': {'UniqueValidator': 50},
+        })
+        self.assertEqual(friendly.VALIDATION_FAILED_CODE, 1)
+        self.assertEqual(friendly.FRIENDLY_FIELD_ERRORS['CharField']['required'], 10)
+        self.assertEqual(friendly.FRIENDLY_FIELD_ERRORS['CharField']['blank'], 2031)
+        self.assertEqual(friendly.FRIENDLY_FIELD_ERRORS['CustomField']['null'], 12)
+        self.assertEqual(friendly.FRIENDLY_VALIDATOR_ERRORS['UniqueValidator'], 50)
+        self.assertEqual(DEFAULT_FIELD_ERRORS['CharField']['required'], 2002)
+
+    def test_tables_are_frozen(self):
+        friendly = FriendlyErrorsSettings({})
+        with self.assertRaises(TypeError):
+            friendly.FRIENDLY_FIELD_ERRORS['CharField']['required'] = 10
+
+    def test_invalid_setting(self):
+        with self.assertRaises(AttributeError):
+            FriendlyErrorsSettings({}).UNKNOWN_SETTING
+
+    def test_reload_on_setting_changed(self):
+        with override_settings(FRIENDLY_ERRORS={'FIELD_ERRORS': {'CharField': {'required': 10}}}):
+            self.assertEqual(settings.FRIENDLY_FIELD_ERRORS['CharField']['required'], 10)
+            self.assertEqual(get_field_error_codes(serializers.CharField)['required'], 10)
+        self.assertEqual(friendly_settings.FRIENDLY_FIELD_ERRORS['CharField']['required'], 2002)
+        self.assertEqual(get_field_error_codes(serializers.CharField)['required'], 2002)
@@ -0,0 +1,102 @@
+import json
+import tracemalloc
+
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from rest_framework_friendly_errors.serializers import FEListSerializer
+from rest_framework_friendly_errors.streaming import StreamingErrorsRenderer, streaming_errors_response
+
+from tests import BaseTestCase
+from tests.serializers import SnippetSerializer
+
+
+class BulkSnippetSerializer(SnippetSerializer):
+    class Meta:
+        list_serializer_class = FEListSerializer
+
+
+class StreamingErrorsRendererTestCase(BaseTestCase):
+
+    def setUp(self):
+        super(StreamingErrorsRendererTestCase, self).setUp()
+        self.renderer = StreamingErrorsRenderer()
+
+    def render(self, serializer):
+        return json.loads(b''.join(self.renderer.iter_render(serializer)).decode())
+
+    def assert_same_as_errors(self, serializer):
+        self.assertFalse(serializer.is_valid())
+        streamed = self.render(serializer)
+        self.assertEqual(streamed, json.loads(JSONRenderer().render(serializer.errors).decode()))
+        return streamed
+
+    def get_bulk_serializer(self, size):
+        items = [dict(self.data_set, linenos='A text instead of a bool') for _ in range(size)]
+        items[1] = dict(self.data_set)
+        return BulkSnippetSerializer(data=items, many=True)
+
+    def test_field_errors(self):
+        self.data_set['linenos'] = 'A text instead of a bool'
+        self.data_set['rating'] = 'text instead of float'
+        streamed = self.assert_same_as_errors(SnippetSerializer(data=self.data_set))
+        self.assertEqual(len(streamed['errors']), 2)
+
+    def test_non_field_error(self):
+        self.data_set['title'] = 'Python'
+        self.data_set['language'] = 'c++'
+        streamed = self.assert_same_as_errors(SnippetSerializer(data=self.data_set))
+        self.assertEqual(streamed['code'], 8000)
+
+    def test_bulk_errors(self):
+        streamed = self.assert_same_as_errors(self.get_bulk_serializer(50))
+        self.assertEqual(len(streamed['errors']), 49)
+        self.assertEqual(streamed['errors'][1]['field'], 2)
+
+    def test_not_a_list(self):
+        self.assert_same_as_errors(BulkSnippetSerializer(data={'title': 'A title'}, many=True))
+
+    def test_small_chunks(self):
+        self.renderer.chunk_size = 10
+        self.renderer.batch_size = 1
+        serializer = self.get_bulk_serializer(5)
+        serializer.is_valid()
+        chunks = list(self.renderer.iter_render(serializer))
+        self.assertGreater(len(chunks), 3)
+        self.assertEqual(json.loads(b''.join(chunks).decode()),
+                         json.loads(JSONRenderer().render(serializer.errors).decode()))
+
+    @override_settings(FRIENDLY_ERRORS={'MAX_ERRORS': 3})
+    def test_truncated(self):
+        streamed = self.assert_same_as_errors(self.get_bulk_serializer(10))
+        self.assertEqual(len(streamed['errors']), 3)
+        self.assertTrue(streamed['truncated'])
+        self.assertEqual(streamed['total'], 9)
+
+    def test_response(self):
+        serializer = self.get_bulk_serializer(3)
+        serializer.is_valid()
+        response = streaming_errors_response(serializer)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json; charset=utf-8')
+        self.assertEqual(json.loads(b''.join(response.streaming_content).decode())['errors'][0]['field'], 0)
+
+    def get_stream_peak_memory(self, size):
+        serializer = self.get_bulk_serializer(size)
+        serializer.is_valid()
+        tracemalloc.start()
+        for _ in self.renderer.iter_render(serializer):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    def test_memory_does_not_grow_with_errors(self):
+        self.renderer.chunk_size = 4096
+        self.renderer.batch_size = 10
+        # The first run builds error code tables
+        self.get_stream_peak_memory(10)
+        small = self.get_stream_peak_memory(500)
+        large = self.get_stream_peak_memory(5000)
+        self.assertLess(large, small * 1.5)
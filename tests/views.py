@@ -1,10 +1,13 @@
 from rest_framework.mixins import (ListModelMixin, CreateModelMixin,
                                    RetrieveModelMixin, UpdateModelMixin)
 from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from tests.models import Snippet
 from tests.serializers import (SnippetModelSerializer,
-                               AnotherSnippetModelSerializer)
+                               AnotherSnippetModelSerializer,
+                               SnippetSerializer)
 
 
 class SnippetList(ListModelMixin,
@@ -42,3 +45,10 @@ class SnippetDetail(RetrieveModelMixin, UpdateModelMixin, GenericAPIView):
 
     def put(self, request, *args, **kwargs):
         return self.update(request, *args, **kwargs)
+
+
+class SnippetValidateView(APIView):
+    def post(self, request, *args, **kwargs):
+        serializer = SnippetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.validated_data)